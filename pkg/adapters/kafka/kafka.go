@@ -241,6 +241,65 @@ func (k *KafkaAdapter) consumeMessages(ctx context.Context, topic string, reader
 	}
 }
 
+// Stream consumes new messages from a topic with its own reader, calling handler for
+// each one until ctx is cancelled or handler returns an error. Unlike Subscribe, every
+// call gets a dedicated reader, so concurrent streams do not interfere with each other.
+//
+// When commit is false no offsets are committed, so a throwaway group leaves no
+// offsets behind and the broker drops its metadata once the stream disconnects.
+// When commit is true, offsets are committed after handler succeeds.
+func (k *KafkaAdapter) Stream(ctx context.Context, topic, groupID string, commit bool, handler adapters.MessageHandler) error {
+	brokers := []string{fmt.Sprintf("%s:%d", k.config.Host, k.config.Port)}
+
+	reader := kafka.NewReader(kafka.ReaderConfig{
+		Brokers:        brokers,
+		Topic:          topic,
+		GroupID:        groupID,
+		StartOffset:    kafka.LastOffset, // Only applies when the group has no committed offset
+		MinBytes:       1,                // Deliver messages as soon as they arrive
+		MaxBytes:       10e6,             // 10MB
+		MaxWait:        500 * time.Millisecond,
+		CommitInterval: time.Second, // Batch commits instead of one round trip per message
+	})
+	defer reader.Close()
+
+	command := fmt.Sprintf("STREAM topic '%s' with group '%s'", topic, groupID)
+	k.LogActivity("STREAM", command, 0, nil, fmt.Sprintf("Streaming topic '%s'", topic))
+
+	for {
+		// FetchMessage leaves committing to us, unlike ReadMessage
+		msg, err := reader.FetchMessage(ctx)
+		if err != nil {
+			if ctx.Err() != nil {
+				// Client went away
+				return nil
+			}
+			return err
+		}
+
+		message := &adapters.Message{
+			Topic:     msg.Topic,
+			Key:       msg.Key,
+			Value:     msg.Value,
+			Timestamp: msg.Time,
+			Offset:    msg.Offset,
+			Headers:   make(map[string]string),
+		}
+		for _, header := range msg.Headers {
+			message.Headers[header.Key] = string(header.Value)
+		}
+
+		if err := handler(ctx, message); err != nil {
+			return err
+		}
+		if commit {
+			if err := reader.CommitMessages(ctx, msg); err != nil && ctx.Err() == nil {
+				return err
+			}
+		}
+	}
+}
+
 // Unsubscribe unsubscribes from a topic
 func (k *KafkaAdapter) Unsubscribe(ctx context.Context, topic string) error {
 	start := time.Now()
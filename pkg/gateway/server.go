@@ -81,6 +81,7 @@ func (s *Server) setupRoutes() {
 	// Database operation routes
 	api.HandleFunc("/clusters/{cluster_id}/db/execute", s.handleDBExecute).Methods("POST")
 	api.HandleFunc("/clusters/{cluster_id}/db/query", s.handleDBQuery).Methods("POST")
+	api.HandleFunc("/clusters/{cluster_id}/db/query_stream", s.handleDBQueryStream).Methods("POST")
 
 	// Cache operation routes
 	api.HandleFunc("/clusters/{cluster_id}/cache/get", s.handleCacheGet).Methods("POST")
@@ -89,6 +90,7 @@ func (s *Server) setupRoutes() {
 
 	// Queue/Kafka operation routes
 	api.HandleFunc("/clusters/{cluster_id}/queue/publish", s.handleQueuePublish).Methods("POST")
+	api.HandleFunc("/clusters/{cluster_id}/queue/subscribe", s.handleQueueSubscribe).Methods("GET")
 	api.HandleFunc("/clusters/{cluster_id}/queue/topics", s.handleListTopics).Methods("GET")
 	api.HandleFunc("/clusters/{cluster_id}/queue/topics", s.handleCreateTopic).Methods("POST")
 	api.HandleFunc("/clusters/{cluster_id}/queue/topics/{topic}", s.handleDeleteTopic).Methods("DELETE")
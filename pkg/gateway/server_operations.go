@@ -1,14 +1,21 @@
 package gateway
 
 import (
+	"context"
 	"encoding/json"
+	"fmt"
+	"io"
+	"mime"
 	"net/http"
+	"sync"
 	"time"
 
 	"github.com/akmadan/throome/internal/logger"
+	"github.com/akmadan/throome/pkg/adapters"
 	"github.com/akmadan/throome/pkg/adapters/kafka"
 	"github.com/akmadan/throome/pkg/adapters/postgres"
 	"github.com/akmadan/throome/pkg/adapters/redis"
+	"github.com/google/uuid"
 	"github.com/gorilla/mux"
 	"github.com/jackc/pgx/v5"
 	"go.uber.org/zap"
@@ -29,6 +36,14 @@ type DBQueryResponse struct {
 	Rows []map[string]interface{} `json:"rows"`
 }
 
+// DBRowEvent is one line of a streamed query response. A successful stream ends with
+// an event with Done set; a non-empty Error ends it early.
+type DBRowEvent struct {
+	Row   json.RawMessage `json:"row,omitempty"`
+	Error string          `json:"error,omitempty"`
+	Done  bool            `json:"done,omitempty"`
+}
+
 type DBExecuteResponse struct {
 	RowsAffected int64 `json:"rows_affected"`
 }
@@ -39,9 +54,10 @@ type CacheGetRequest struct {
 }
 
 type CacheSetRequest struct {
-	Key   string `json:"key"`
-	Value string `json:"value"`
-	TTL   int    `json:"ttl"` // TTL in seconds
+	Key        string  `json:"key"`
+	Value      string  `json:"value"`
+	TTL        int     `json:"ttl"`        // TTL in seconds
+	Expiration float64 `json:"expiration"` // TTL in seconds, as sent by the SDKs; 0 means no expiry
 }
 
 type CacheDeleteRequest struct {
@@ -175,6 +191,98 @@ func (s *Server) handleDBQuery(w http.ResponseWriter, r *http.Request) {
 	})
 }
 
+// handleDBQueryStream handles database query operations, streaming rows as newline-delimited JSON
+// instead of collecting the whole result set in memory
+func (s *Server) handleDBQueryStream(w http.ResponseWriter, r *http.Request) {
+	vars := mux.Vars(r)
+	clusterID := vars["cluster_id"]
+
+	var req DBQueryRequest
+	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+		s.errorResponse(w, http.StatusBadRequest, "Invalid request body", err)
+		return
+	}
+
+	// Find the PostgreSQL service in the cluster
+	config, err := s.gateway.GetClusterConfig(clusterID)
+	if err != nil {
+		s.errorResponse(w, http.StatusNotFound, "Cluster not found", err)
+		return
+	}
+
+	var postgresService string
+	for serviceName, serviceConfig := range config.Services {
+		if serviceConfig.Type == "postgres" {
+			postgresService = serviceName
+			break
+		}
+	}
+
+	if postgresService == "" {
+		s.errorResponse(w, http.StatusNotFound, "No PostgreSQL service found in cluster", nil)
+		return
+	}
+
+	// Get the adapter
+	adapter, err := s.gateway.GetAdapter(clusterID, postgresService)
+	if err != nil {
+		s.errorResponse(w, http.StatusInternalServerError, "Failed to get database adapter", err)
+		return
+	}
+
+	// Type assert to PostgresAdapter
+	pgAdapter, ok := adapter.(*postgres.PostgresAdapter)
+	if !ok {
+		s.errorResponse(w, http.StatusInternalServerError, "Adapter is not a PostgresAdapter", nil)
+		return
+	}
+
+	pool := pgAdapter.GetPool()
+	pgxRows, err := pool.Query(r.Context(), req.Query, req.Args...)
+	if err != nil {
+		s.errorResponse(w, http.StatusInternalServerError, "Failed to execute query", err)
+		return
+	}
+	defer pgxRows.Close()
+
+	// Large result sets can take longer to send than the server's write timeout
+	rc := http.NewResponseController(w)
+	if err := rc.SetWriteDeadline(time.Time{}); err != nil {
+		logger.Warn("Failed to clear write deadline for query stream", zap.Error(err))
+	}
+
+	w.Header().Set("Content-Type", "application/x-ndjson")
+	w.WriteHeader(http.StatusOK)
+
+	// Encoder.Encode terminates every value with a newline
+	encoder := json.NewEncoder(w)
+	for pgxRows.Next() {
+		row, err := pgx.RowToMap(pgxRows)
+		if err != nil {
+			_ = encoder.Encode(DBRowEvent{Error: "Failed to read row: " + err.Error()}) //nolint:errcheck // stream is already failing
+			return
+		}
+		// Marshal separately so values JSON can't represent (such as NaN) are
+		// reported to the client instead of looking like a dropped connection
+		data, err := json.Marshal(row)
+		if err != nil {
+			_ = encoder.Encode(DBRowEvent{Error: "Failed to encode row: " + err.Error()}) //nolint:errcheck // stream is already failing
+			return
+		}
+		if err := encoder.Encode(DBRowEvent{Row: data}); err != nil {
+			// Client went away
+			return
+		}
+	}
+
+	if err := pgxRows.Err(); err != nil {
+		_ = encoder.Encode(DBRowEvent{Error: "Failed to read rows: " + err.Error()}) //nolint:errcheck // stream is already failing
+		return
+	}
+	// Lets clients tell a complete result set from a truncated one
+	_ = encoder.Encode(DBRowEvent{Done: true}) //nolint:errcheck // nothing left to do if the client went away
+}
+
 // handleCacheGet handles cache GET operations
 func (s *Server) handleCacheGet(w http.ResponseWriter, r *http.Request) {
 	vars := mux.Vars(r)
@@ -279,6 +387,9 @@ func (s *Server) handleCacheSet(w http.ResponseWriter, r *http.Request) {
 
 	// Set the value
 	ttl := time.Duration(req.TTL) * time.Second
+	if ttl == 0 {
+		ttl = time.Duration(req.Expiration * float64(time.Second))
+	}
 	if err := redisAdapter.Set(r.Context(), req.Key, req.Value, ttl); err != nil {
 		s.errorResponse(w, http.StatusInternalServerError, "Failed to set key", err)
 		return
@@ -363,13 +474,43 @@ type ListTopicsResponse struct {
 	Topics []string `json:"topics"`
 }
 
+// QueueMessageEvent is the payload of each server-sent event on a subscribe stream
+type QueueMessageEvent struct {
+	Topic     string            `json:"topic"`
+	Key       []byte            `json:"key,omitempty"`
+	Value     []byte            `json:"value"`
+	Headers   map[string]string `json:"headers,omitempty"`
+	Offset    int64             `json:"offset"`
+	Timestamp time.Time         `json:"timestamp"`
+}
+
+// subscribeHeartbeatInterval is how often an idle subscribe stream sends a keep-alive comment
+const subscribeHeartbeatInterval = 15 * time.Second
+
 // handleQueuePublish handles message publishing to Kafka topics
 func (s *Server) handleQueuePublish(w http.ResponseWriter, r *http.Request) {
 	vars := mux.Vars(r)
 	clusterID := vars["cluster_id"]
 
 	var req QueuePublishRequest
-	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+	if mediaType, _, _ := mime.ParseMediaType(r.Header.Get("Content-Type")); mediaType == "application/octet-stream" {
+		// Raw bodies carry the message as-is, with topic and key in the query string,
+		// which spares large payloads the base64 round trip through JSON
+		req.Topic = r.URL.Query().Get("topic")
+		if req.Topic == "" {
+			s.errorResponse(w, http.StatusBadRequest, "Missing topic query parameter", nil)
+			return
+		}
+		if key := r.URL.Query().Get("key"); key != "" {
+			req.Key = []byte(key)
+		}
+		message, err := io.ReadAll(r.Body)
+		if err != nil {
+			s.errorResponse(w, http.StatusBadRequest, "Failed to read request body", err)
+			return
+		}
+		req.Message = message
+	} else if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
 		s.errorResponse(w, http.StatusBadRequest, "Invalid request body", err)
 		return
 	}
@@ -426,6 +567,131 @@ func (s *Server) handleQueuePublish(w http.ResponseWriter, r *http.Request) {
 	})
 }
 
+// handleQueueSubscribe streams messages from a Kafka topic to the client as server-sent events
+func (s *Server) handleQueueSubscribe(w http.ResponseWriter, r *http.Request) {
+	vars := mux.Vars(r)
+	clusterID := vars["cluster_id"]
+
+	topic := r.URL.Query().Get("topic")
+	if topic == "" {
+		s.errorResponse(w, http.StatusBadRequest, "Missing topic query parameter", nil)
+		return
+	}
+
+	// Every stream gets its own consumer group unless the client asks to share one.
+	// Throwaway groups never commit offsets, so nothing is left on the broker once
+	// the stream ends; only named groups track their position.
+	groupID := r.URL.Query().Get("group")
+	commit := groupID != ""
+	if !commit {
+		groupID = "throome-stream-" + uuid.New().String()
+	}
+
+	// Find the Kafka service in the cluster
+	config, err := s.gateway.GetClusterConfig(clusterID)
+	if err != nil {
+		s.errorResponse(w, http.StatusNotFound, "Cluster not found", err)
+		return
+	}
+
+	var kafkaService string
+	for serviceName, serviceConfig := range config.Services {
+		if serviceConfig.Type == "kafka" {
+			kafkaService = serviceName
+			break
+		}
+	}
+
+	if kafkaService == "" {
+		s.errorResponse(w, http.StatusNotFound, "No Kafka service found in cluster", nil)
+		return
+	}
+
+	// Get the adapter
+	adapter, err := s.gateway.GetAdapter(clusterID, kafkaService)
+	if err != nil {
+		s.errorResponse(w, http.StatusInternalServerError, "Failed to get Kafka adapter", err)
+		return
+	}
+
+	// Type assert to KafkaAdapter
+	kafkaAdapter, ok := adapter.(*kafka.KafkaAdapter)
+	if !ok {
+		s.errorResponse(w, http.StatusInternalServerError, "Adapter is not a KafkaAdapter", nil)
+		return
+	}
+
+	// Streams outlive the server's write timeout, so lift it for this response
+	rc := http.NewResponseController(w)
+	if err := rc.SetWriteDeadline(time.Time{}); err != nil {
+		logger.Warn("Failed to clear write deadline for subscribe stream", zap.Error(err))
+	}
+
+	w.Header().Set("Content-Type", "text/event-stream")
+	w.Header().Set("Cache-Control", "no-cache")
+	w.WriteHeader(http.StatusOK)
+	_ = rc.Flush() //nolint:errcheck // a dead client surfaces on the next write
+
+	// Writes come from both the consumer and the heartbeat goroutine
+	var mu sync.Mutex
+	write := func(data string) error {
+		mu.Lock()
+		defer mu.Unlock()
+		if _, err := fmt.Fprint(w, data); err != nil {
+			return err
+		}
+		return rc.Flush()
+	}
+
+	ctx, cancel := context.WithCancel(r.Context())
+	var wg sync.WaitGroup
+	defer func() {
+		cancel()
+		wg.Wait()
+	}()
+
+	// Keep idle streams alive through clients and proxies that drop silent connections
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		ticker := time.NewTicker(subscribeHeartbeatInterval)
+		defer ticker.Stop()
+		for {
+			select {
+			case <-ctx.Done():
+				return
+			case <-ticker.C:
+				if err := write(": ping\n\n"); err != nil {
+					cancel()
+					return
+				}
+			}
+		}
+	}()
+
+	err = kafkaAdapter.Stream(ctx, topic, groupID, commit, func(ctx context.Context, message *adapters.Message) error {
+		data, err := json.Marshal(QueueMessageEvent{
+			Topic:     message.Topic,
+			Key:       message.Key,
+			Value:     message.Value,
+			Headers:   message.Headers,
+			Offset:    message.Offset,
+			Timestamp: message.Timestamp,
+		})
+		if err != nil {
+			return err
+		}
+		return write(fmt.Sprintf("data: %s\n\n", data))
+	})
+	if err != nil {
+		logger.Error("Subscribe stream ended with error",
+			zap.String("cluster_id", clusterID),
+			zap.String("topic", topic),
+			zap.Error(err),
+		)
+	}
+}
+
 // handleListTopics handles listing Kafka topics
 func (s *Server) handleListTopics(w http.ResponseWriter, r *http.Request) {
 	vars := mux.Vars(r)
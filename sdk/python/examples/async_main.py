@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Throome SDK Python asyncio Example"""
+
+import asyncio
+from throome import AsyncThroomClient, ServiceConfig, ActivityFilters
+
+
+async def main():
+    # Initialize the async Throome client
+    async with AsyncThroomClient(base_url="http://localhost:9000") as client:
+        # Example 1: Check gateway health and list clusters concurrently
+        print("=== Gateway Health & Clusters ===")
+        health, clusters = await asyncio.gather(client.health(), client.list_clusters())
+        print(f"Gateway Status: {health.status}")
+        print(f"Found {len(clusters)} cluster(s)\n")
+
+        # Example 2: Create a new cluster
+        print("=== Creating a New Cluster ===")
+        services = {
+            "redis-1": ServiceConfig(type="redis", provision=True, port=6380),
+            "postgres-1": ServiceConfig(
+                type="postgres",
+                provision=True,
+                port=5434,
+                username="postgres",
+                password="password",
+                database="demo_db",
+            ),
+        }
+
+        create_response = await client.create_cluster(name="demo-cluster", services=services)
+        cluster_id = create_response.cluster_id
+        print(f"Created cluster: demo-cluster ({cluster_id})\n")
+
+        # Wait for services to be ready
+        print("Waiting for services to be ready...")
+        await asyncio.sleep(10)
+
+        cluster_client = client.cluster(cluster_id)
+
+        # Example 3: Bulk cache operations in parallel
+        print("=== Cache Operations ===")
+        cache = cluster_client.cache()
+        items = {f"user:{i}": f"User {i}" for i in range(10)}
+
+        await cache.mset(items, expiration=60)
+        print(f"Set {len(items)} keys concurrently")
+
+        values = await asyncio.gather(*(cache.get(k) for k in items))
+        print(f"Got {len(values)} values: {', '.join(values)}\n")
+
+        # Example 4: Pull health, metrics and activity in parallel
+        print("=== Cluster Overview ===")
+        cluster_health, metrics, activity_logs = await asyncio.gather(
+            cluster_client.health(),
+            cluster_client.metrics(),
+            cluster_client.get_activity(filters=ActivityFilters(limit=10)),
+        )
+        for service_name, service_health in cluster_health.services.items():
+            status = "healthy" if service_health.healthy else "unhealthy"
+            print(f"- {service_name}: {status}")
+        print(f"Requests: {metrics.requests}, errors: {metrics.errors}")
+        print(f"Recent activity: {len(activity_logs)} logs\n")
+
+        # Example 5: Cleanup - Delete the cluster
+        print("=== Cleanup ===")
+        await client.delete_cluster(cluster_id)
+        print(f"Deleted cluster: {cluster_id}")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except Exception as e:
+        print(f"Error: {e}")
+        exit(1)
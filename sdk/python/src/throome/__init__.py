@@ -8,6 +8,14 @@ from .client import (
     CacheClient,
     QueueClient,
 )
+from .async_client import (
+    AsyncThroomClient,
+    AsyncClusterClient,
+    AsyncServiceClient,
+    AsyncDBClient,
+    AsyncCacheClient,
+    AsyncQueueClient,
+)
 from .types import (
     Cluster,
     Service,
@@ -23,9 +31,8 @@ from .types import (
     ActivityFilters,
     LogOptions,
 )
-from .exceptions import ThroomAPIError, ThroomConnectionError
-
-__version__ = "0.1.0"
+from .exceptions import ThroomError, ThroomAPIError, ThroomConnectionError
+from ._version import __version__
 
 __all__ = [
     "ThroomClient",
@@ -34,6 +41,12 @@ __all__ = [
     "DBClient",
     "CacheClient",
     "QueueClient",
+    "AsyncThroomClient",
+    "AsyncClusterClient",
+    "AsyncServiceClient",
+    "AsyncDBClient",
+    "AsyncCacheClient",
+    "AsyncQueueClient",
     "Cluster",
     "Service",
     "CreateClusterRequest",
@@ -47,6 +60,7 @@ __all__ = [
     "ActivityLog",
     "ActivityFilters",
     "LogOptions",
+    "ThroomError",
     "ThroomAPIError",
     "ThroomConnectionError",
 ]
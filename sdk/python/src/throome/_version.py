@@ -0,0 +1,3 @@
+"""Throome SDK version"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,566 @@
+"""Throome SDK asyncio client"""
+
+import base64
+import importlib.util
+import inspect
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from .types import (
+    Cluster,
+    ServiceConfig,
+    CreateClusterResponse,
+    HealthResponse,
+    ClusterHealthResponse,
+    MetricsResponse,
+    ServiceInfo,
+    ActivityLog,
+    ActivityFilters,
+    LogOptions,
+)
+from .exceptions import ThroomConnectionError
+from .client import (
+    DEFAULT_HEADERS,
+    OCTET_STREAM_HEADERS,
+    STREAM_CHUNK_SIZE,
+    BATCH_MAX_WORKERS,
+    SUBSCRIBE_BASE_BACKOFF,
+    SUBSCRIBE_MAX_BACKOFF,
+    RETRY_TOTAL,
+    RETRY_STATUSES,
+    IDEMPOTENT_METHODS,
+    Message,
+    _SSEParser,
+    _backoff_delay,
+    _retry_delay,
+    _CircuitBreaker,
+    _circuit_break,
+    _raise_for_status,
+    _row_from_event,
+    _decode_json,
+    _default_pool_size,
+    _encode_body,
+    _message_body,
+    _handle_response,
+    _cluster_from_dict,
+    _clusters_from_list,
+    _activity_from_list,
+    _cluster_health_from_dict,
+    _services_payload,
+    _activity_params,
+    _log_params,
+    _ttl_cache,
+)
+
+
+async def _aiter_body(body: Any) -> AsyncIterator[Any]:
+    """Stream a buffer or binary file as a chunked httpx request body"""
+    if hasattr(body, "read"):
+        for chunk in iter(lambda: body.read(STREAM_CHUNK_SIZE), b""):
+            yield chunk
+    else:
+        yield body
+
+
+class AsyncThroomClient:
+    """
+    Asyncio Throome SDK client
+
+    Mirrors ThroomClient, but every network call is a coroutine so independent
+    calls can run concurrently with asyncio.gather. Requires httpx
+    (pip install "throome-sdk[async]").
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 120,
+        topology_cache_ttl: float = 2.0,
+        pool_size: Optional[int] = None,
+        http2: Optional[bool] = None,
+        circuit_breaker_threshold: int = 5,
+        circuit_breaker_reset: float = 30.0,
+    ):
+        """
+        Initialize async Throome client
+
+        Args:
+            base_url: Base URL of the Throome Gateway
+            timeout: Request timeout in seconds (default: 120)
+            topology_cache_ttl: Seconds to cache list_clusters/get_cluster results
+                (default: 2.0, 0 disables caching)
+            pool_size: Maximum connections to the gateway (default: 8 per CPU, at least 32)
+            http2: Negotiate HTTP/2 with https gateways, multiplexing concurrent calls over
+                one connection (default: enabled when the h2 package is installed)
+            circuit_breaker_threshold: Consecutive gateway outages after which calls fail
+                fast instead of hitting the network (default: 5, 0 disables the breaker)
+            circuit_breaker_reset: Seconds to fail fast before letting a trial call through
+                (default: 30.0)
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                'AsyncThroomClient requires httpx - install with: pip install "throome-sdk[async]"'
+            ) from e
+
+        # Imported here rather than at module level so "import throome" stays light
+        import asyncio
+
+        if http2 is None:
+            http2 = importlib.util.find_spec("h2") is not None
+        pool = pool_size or _default_pool_size()
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._httpx = httpx
+        self._asyncio = asyncio
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            headers=DEFAULT_HEADERS,
+            http2=http2,
+            limits=httpx.Limits(max_connections=pool, max_keepalive_connections=pool),
+        )
+        self.topology_cache_ttl = topology_cache_ttl
+        self._cache: Dict[Any, Any] = {}
+        self._cache_lock = threading.Lock()
+        self._breaker = (
+            _CircuitBreaker(circuit_breaker_threshold, circuit_breaker_reset)
+            if circuit_breaker_threshold > 0
+            else None
+        )
+
+    async def __aenter__(self) -> "AsyncThroomClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool"""
+        await self._client.aclose()
+
+    def invalidate_cache(self) -> None:
+        """Drop cached list_clusters/get_cluster results"""
+        with self._cache_lock:
+            self._cache.clear()
+
+    @_circuit_break
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotent: bool = False,
+        content: Any = None,
+    ) -> Any:
+        """
+        Make an HTTP request to the gateway
+
+        data is sent as JSON, or content as a raw application/octet-stream body.
+        GET and DELETE are retried on transient failures, as is a POST the caller
+        marks ``idempotent``. Failures to connect are retried for every method
+        since nothing reached the gateway.
+        """
+        httpx = self._httpx
+        if content is None:
+            body, headers = _encode_body(data), None
+        else:
+            body, headers = content, OCTET_STREAM_HEADERS
+        retry = idempotent or method in IDEMPOTENT_METHODS
+
+        for attempt in range(RETRY_TOTAL + 1):
+            last = attempt == RETRY_TOTAL
+            response = None
+            try:
+                response = await self._client.request(
+                    method, path, content=body, params=params, headers=headers
+                )
+            except httpx.TimeoutException as e:
+                if last or not (retry or isinstance(e, httpx.ConnectTimeout)):
+                    raise ThroomConnectionError(f"Request timed out: {e}")
+            except httpx.TransportError as e:
+                if last or not (retry or isinstance(e, httpx.ConnectError)):
+                    raise ThroomConnectionError(f"Connection error: {e}")
+            except httpx.HTTPError as e:
+                raise ThroomConnectionError(f"Connection error: {e}")
+
+            if response is not None and (
+                last or not retry or response.status_code not in RETRY_STATUSES
+            ):
+                return _handle_response(response)
+
+            await self._asyncio.sleep(_retry_delay(attempt, response))
+
+    async def health(self) -> HealthResponse:
+        """Get gateway health"""
+        data = await self._request("GET", "/api/v1/health")
+        return HealthResponse(**data)
+
+    @_ttl_cache
+    async def list_clusters(self) -> List[Cluster]:
+        """List all clusters"""
+        data = await self._request("GET", "/api/v1/clusters")
+        return _clusters_from_list(data)
+
+    @_ttl_cache
+    async def get_cluster(self, cluster_id: str) -> Cluster:
+        """Get a specific cluster"""
+        data = await self._request("GET", f"/api/v1/clusters/{cluster_id}")
+        return _cluster_from_dict(data)
+
+    async def create_cluster(
+        self, name: str, services: Dict[str, ServiceConfig]
+    ) -> CreateClusterResponse:
+        """Create a new cluster"""
+        data = await self._request(
+            "POST", "/api/v1/clusters", {"name": name, "services": _services_payload(services)}
+        )
+        self.invalidate_cache()
+        return CreateClusterResponse(**data)
+
+    async def delete_cluster(self, cluster_id: str) -> None:
+        """Delete a cluster"""
+        await self._request("DELETE", f"/api/v1/clusters/{cluster_id}")
+        self.invalidate_cache()
+
+    async def get_activity(self, filters: Optional[ActivityFilters] = None) -> List[ActivityLog]:
+        """Get global activity logs"""
+        data = await self._request("GET", "/api/v1/activity", params=_activity_params(filters))
+        return _activity_from_list(data)
+
+    def cluster(self, cluster_id: str) -> "AsyncClusterClient":
+        """Get a cluster client for cluster-specific operations"""
+        return AsyncClusterClient(self, cluster_id)
+
+
+class AsyncClusterClient:
+    """Async client for cluster-specific operations"""
+
+    def __init__(self, client: AsyncThroomClient, cluster_id: str):
+        self._client = client
+        self.cluster_id = cluster_id
+        self._base = f"/api/v1/clusters/{cluster_id}"
+
+    async def health(self) -> ClusterHealthResponse:
+        """Get cluster health"""
+        data = await self._client._request("GET", self._base + "/health")
+        return _cluster_health_from_dict(data)
+
+    async def metrics(self) -> MetricsResponse:
+        """Get cluster metrics"""
+        data = await self._client._request("GET", self._base + "/metrics")
+        return MetricsResponse(**data)
+
+    async def get_activity(self, filters: Optional[ActivityFilters] = None) -> List[ActivityLog]:
+        """Get cluster activity logs"""
+        data = await self._client._request(
+            "GET", self._base + "/activity", params=_activity_params(filters)
+        )
+        return _activity_from_list(data)
+
+    def service(self, service_name: str) -> "AsyncServiceClient":
+        """Get a service client"""
+        return AsyncServiceClient(self._client, self.cluster_id, service_name)
+
+    def db(self) -> "AsyncDBClient":
+        """Get a database client"""
+        return AsyncDBClient(self._client, self.cluster_id)
+
+    def cache(self) -> "AsyncCacheClient":
+        """Get a cache client"""
+        return AsyncCacheClient(self._client, self.cluster_id)
+
+    def queue(self) -> "AsyncQueueClient":
+        """Get a queue client"""
+        return AsyncQueueClient(self._client, self.cluster_id)
+
+
+class AsyncServiceClient:
+    """Async client for service-specific operations"""
+
+    def __init__(self, client: AsyncThroomClient, cluster_id: str, service_name: str):
+        self._client = client
+        self.cluster_id = cluster_id
+        self.service_name = service_name
+        self._base = f"/api/v1/clusters/{cluster_id}/services/{service_name}"
+
+    async def get_info(self) -> ServiceInfo:
+        """Get service information"""
+        data = await self._client._request("GET", self._base)
+        return ServiceInfo(**data)
+
+    async def get_logs(self, options: Optional[LogOptions] = None) -> str:
+        """Get service Docker container logs"""
+        chunks = [chunk async for chunk in self.get_logs_stream(options)]
+        return b"".join(chunks).decode("utf-8", errors="replace")
+
+    async def get_logs_stream(self, options: Optional[LogOptions] = None) -> AsyncIterator[bytes]:
+        """
+        Stream service Docker container logs
+
+        Yields the raw log output in chunks as it is received, so large logs are
+        never held in memory at once.
+        """
+        httpx = self._client._httpx
+        try:
+            async with self._client._client.stream(
+                "GET", self._base + "/logs", params=_log_params(options)
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    yield chunk
+        except httpx.HTTPError as e:
+            raise ThroomConnectionError(f"Failed to get logs: {e}")
+
+    async def get_activity(self, filters: Optional[ActivityFilters] = None) -> List[ActivityLog]:
+        """Get service activity logs"""
+        data = await self._client._request(
+            "GET",
+            self._base + "/activity",
+            params=_activity_params(filters),
+        )
+        return _activity_from_list(data)
+
+
+class AsyncDBClient:
+    """Async client for database operations"""
+
+    def __init__(self, client: AsyncThroomClient, cluster_id: str):
+        self._client = client
+        self.cluster_id = cluster_id
+        self._base = f"/api/v1/clusters/{cluster_id}"
+        self._execute_path = self._base + "/db/execute"
+        self._query_path = self._base + "/db/query"
+        self._query_stream_path = self._base + "/db/query_stream"
+
+    async def execute(self, query: str, *args: Any) -> None:
+        """Execute a SQL statement without returning results"""
+        await self._client._request(
+            "POST",
+            self._execute_path,
+            {"query": query, "args": args},
+        )
+
+    async def query(self, query: str, *args: Any, idempotent: bool = False) -> List[Dict[str, Any]]:
+        """
+        Execute a SQL query and return results
+
+        Pass ``idempotent=True`` for read-only queries to have them retried on
+        transient gateway failures. It is off by default because a query may write
+        (``INSERT ... RETURNING``, ``nextval()``) and may already have run.
+        """
+        data = await self._client._request(
+            "POST",
+            self._query_path,
+            {"query": query, "args": args},
+            idempotent=idempotent,
+        )
+        return data["rows"]
+
+    async def query_iter(self, query: str, *args: Any) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a SQL query and yield rows as they arrive
+
+        Rows are streamed by the gateway as newline-delimited JSON, so memory use
+        stays flat no matter how large the result set is. If the stream ends before
+        the last row, ThroomConnectionError is raised rather than stopping early.
+        """
+        httpx = self._client._httpx
+        try:
+            async with self._client._client.stream(
+                "POST",
+                self._query_stream_path,
+                content=_encode_body({"query": query, "args": args}),
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    _raise_for_status(response)
+                async for line in response.aiter_lines():
+                    if line:
+                        row = _row_from_event(line)
+                        if row is None:
+                            return
+                        yield row
+        except httpx.TimeoutException as e:
+            raise ThroomConnectionError(f"Request timed out: {e}")
+        except httpx.HTTPError as e:
+            raise ThroomConnectionError(f"Connection error: {e}")
+        # The gateway ends every complete result set with a marker
+        raise ThroomConnectionError("Connection error: query stream ended before the last row")
+
+    async def query_row(self, query: str, *args: Any, idempotent: bool = False) -> Dict[str, Any]:
+        """Execute a query that returns a single row"""
+        rows = await self.query(query, *args, idempotent=idempotent)
+        if not rows:
+            raise ValueError("No rows returned")
+        return rows[0]
+
+
+class AsyncCacheClient:
+    """Async client for cache operations"""
+
+    def __init__(self, client: AsyncThroomClient, cluster_id: str):
+        self._client = client
+        self.cluster_id = cluster_id
+        self._base = f"/api/v1/clusters/{cluster_id}"
+        self._get_path = self._base + "/cache/get"
+        self._set_path = self._base + "/cache/set"
+        self._delete_path = self._base + "/cache/delete"
+        # Bound once; cache calls are often issued in tight loops
+        self._request = client._request
+
+    async def get(self, key: str) -> str:
+        """Get a value from cache"""
+        data = await self._request("POST", self._get_path, {"key": key}, idempotent=True)
+        return data["value"]
+
+    async def set(self, key: str, value: str, expiration: int = 0) -> None:
+        """
+        Set a value in cache
+
+        Args:
+            key: Cache key
+            value: Cache value
+            expiration: Expiration time in seconds (0 means no expiry)
+        """
+        await self._request(
+            "POST",
+            self._set_path,
+            {"key": key, "value": value, "expiration": expiration},
+            idempotent=True,
+        )
+
+    async def delete(self, key: str) -> None:
+        """Delete a key from cache"""
+        await self._request("POST", self._delete_path, {"key": key}, idempotent=True)
+
+    async def mset(self, items: Dict[str, str], expiration: int = 0) -> None:
+        """
+        Set multiple values in cache concurrently
+
+        Args:
+            items: Mapping of cache keys to values
+            expiration: Expiration time in seconds, applied to every key (0 means no expiry)
+        """
+        if not items:
+            return
+        await self._run_batch(self.set(k, v, expiration) for k, v in items.items())
+
+    async def mdelete(self, keys: List[str]) -> None:
+        """Delete multiple keys from cache concurrently"""
+        if not keys:
+            return
+        await self._run_batch(self.delete(k) for k in keys)
+
+    async def _run_batch(self, calls: Iterable[Awaitable[None]]) -> None:
+        """
+        Await calls with at most BATCH_MAX_WORKERS in flight, like the sync client's pool
+
+        Every call runs to completion, then the first failure is re-raised.
+        """
+        asyncio = self._client._asyncio
+        semaphore = asyncio.Semaphore(BATCH_MAX_WORKERS)
+
+        async def bounded(call: Awaitable[None]) -> None:
+            async with semaphore:
+                await call
+
+        results = await asyncio.gather(*map(bounded, calls), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+
+class AsyncQueueClient:
+    """Async client for queue/message broker operations"""
+
+    def __init__(self, client: AsyncThroomClient, cluster_id: str):
+        self._client = client
+        self.cluster_id = cluster_id
+        self._base = f"/api/v1/clusters/{cluster_id}"
+        self._publish_path = self._base + "/queue/publish"
+        self._subscribe_path = self._base + "/queue/subscribe"
+
+    async def publish(self, topic: str, message: Message) -> None:
+        """
+        Publish a message to a topic
+
+        The message may be bytes, a bytearray or memoryview, or a binary file-like
+        object. It is sent as the raw request body, so buffers are not copied and
+        files are streamed from their current position.
+        """
+        body = _message_body(message)
+        if not isinstance(body, bytes):
+            # httpx only takes bytes as-is; anything else is streamed
+            body = _aiter_body(body)
+        await self._client._request(
+            "POST", self._publish_path, params={"topic": topic}, content=body
+        )
+
+    async def subscribe(
+        self, topic: str, handler: Callable[[bytes], Any], group: Optional[str] = None
+    ) -> None:
+        """
+        Subscribe to a topic, calling handler with each message as it arrives
+
+        The gateway pushes messages over one long-lived server-sent events stream.
+        Dropped connections are re-established with exponential backoff, so this
+        runs until handler raises or the task is cancelled.
+
+        Args:
+            topic: Topic to consume
+            handler: Called with the raw bytes of every message; may be a coroutine function
+            group: Kafka consumer group to join. Offsets are committed only for a named
+                group, so it resumes where it left off after a reconnect. By default every
+                connection gets a fresh, uncommitted group and only sees messages
+                published after it connects.
+        """
+        params = {"topic": topic}
+        if group:
+            params["group"] = group
+        httpx = self._client._httpx
+
+        client = self._client._client
+        request = client.build_request(
+            "GET", self._subscribe_path, params=params, headers={"Accept": "text/event-stream"}
+        )
+
+        attempt = 0
+        while True:
+            try:
+                response = await client.send(request, stream=True)
+            except httpx.HTTPError:
+                response = None
+
+            # Only connection failures and 5xx reconnect; errors from handler propagate
+            if response is not None:
+                try:
+                    if response.status_code < 500:
+                        if response.status_code >= 400:
+                            await response.aread()
+                            _raise_for_status(response)
+                        attempt = 0
+                        async for message in self._messages(response):
+                            result = handler(message)
+                            if inspect.isawaitable(result):
+                                await result
+                finally:
+                    await response.aclose()
+
+            delay = _backoff_delay(attempt, SUBSCRIBE_BASE_BACKOFF, SUBSCRIBE_MAX_BACKOFF)
+            await self._client._asyncio.sleep(delay)
+            attempt += 1
+
+    async def _messages(self, response: Any) -> AsyncIterator[bytes]:
+        """Yield messages from a subscribe stream until the connection drops"""
+        parser = _SSEParser()
+        try:
+            async for line in response.aiter_lines():
+                data = parser.feed(line)
+                if data is not None:
+                    yield base64.b64decode(_decode_json(data)["value"])
+        except self._client._httpx.HTTPError:
+            return
@@ -1,8 +1,38 @@
 """Throome SDK client"""
 
-from typing import Any, Dict, List, Optional
-import requests
-from requests.exceptions import RequestException, Timeout
+import base64
+import functools
+import inspect
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, is_dataclass
+from datetime import date, time as dt_time
+from enum import Enum
+from uuid import UUID
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
 
 from .types import (
     Cluster,
@@ -19,108 +49,580 @@ from .types import (
     ActivityFilters,
     LogOptions,
 )
-from .exceptions import ThroomAPIError, ThroomConnectionError
+from .exceptions import ThroomError, ThroomAPIError, ThroomConnectionError
+from ._version import __version__
+
+# Headers sent with every request. Compressed responses are decoded transparently.
+DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": f"throome-python/{__version__}",
+}
+
+# Headers for requests whose body is raw bytes rather than JSON
+OCTET_STREAM_HEADERS = {"Content-Type": "application/octet-stream"}
+
+# Maximum length of a non-JSON error body quoted in ThroomAPIError
+ERROR_TEXT_LIMIT = 512
+
+# Chunk size used when streaming logs and query results
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Upper bound on concurrent requests issued by batch cache operations
+BATCH_MAX_WORKERS = 32
+
+# Reconnect delays (seconds) for queue subscriptions
+SUBSCRIBE_BASE_BACKOFF = 0.5
+SUBSCRIBE_MAX_BACKOFF = 30.0
+
+# Retry policy for transient gateway failures. GET and DELETE are always safe to
+# retry; POSTs are only retried when the call is marked idempotent.
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.2
+RETRY_MAX_BACKOFF = 30.0
+RETRY_STATUSES = frozenset([429, 502, 503, 504])
+IDEMPOTENT_METHODS = frozenset(["GET", "DELETE"])
+
+# Statuses that count towards opening the circuit breaker. 429 is left out since a
+# rate-limited gateway is still up and other calls would go through.
+OUTAGE_STATUSES = frozenset([502, 503, 504])
+
+_MISSING = object()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _default_pool_size() -> int:
+    """Connections to keep per gateway host: 8 per CPU, at least 32"""
+    return max(32, (os.cpu_count() or 4) * 8)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize the types orjson handles natively, so both encoders accept the same bodies"""
+    if isinstance(value, (date, dt_time)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _encode_body(data: Any) -> Optional[bytes]:
+    """
+    Serialize a request body to JSON bytes, using orjson when available
+
+    Raises ThroomError if the body cannot be serialized, whichever encoder is used.
+    """
+    if data is None:
+        return None
+    try:
+        if orjson is not None:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                pass  # e.g. ints beyond 64 bits, which the stdlib encoder handles
+        return json.dumps(data, separators=(",", ":"), default=_json_default).encode("utf-8")
+    except (TypeError, ValueError) as e:
+        raise ThroomError(f"Request body is not JSON serializable: {e}") from e
+
+
+# Anything QueueClient.publish accepts as a message payload
+Message = Union[bytes, bytearray, memoryview, IO[bytes]]
+
+
+def _message_body(message: Message) -> Any:
+    """
+    Prepare a queue message to be sent as a raw request body
+
+    Buffers and files are passed through so the transport sends them without a copy.
+    Memoryviews are recast to bytes so their length is a byte count; only
+    non-contiguous views have to be copied.
+    """
+    if isinstance(message, memoryview):
+        try:
+            return message.cast("B")
+        except TypeError:
+            return message.tobytes()
+    return message
+
+
+def _backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Exponential backoff with jitter for the given retry attempt (0-based)"""
+    return min(cap, base * 2**attempt) * random.uniform(0.5, 1.0)
+
+
+class _SSEParser:
+    """Incremental parser extracting the data of server-sent events, line by line"""
+
+    def __init__(self) -> None:
+        self._data: List[str] = []
+
+    def feed(self, line: str) -> Optional[str]:
+        """Consume one line, returning the event data once a blank line ends an event"""
+        if not line:
+            if not self._data:
+                return None
+            data = "\n".join(self._data)
+            self._data = []
+            return data
+        if line.startswith("data:"):
+            value = line[5:]
+            self._data.append(value[1:] if value.startswith(" ") else value)
+        # Comments (":") and other fields are ignored
+        return None
+
+
+def _retry_delay(attempt: int, response: Any = None) -> float:
+    """Seconds to wait before retrying, honoring a Retry-After header given in seconds"""
+    retry_after = response.headers.get("retry-after", "") if response is not None else ""
+    if retry_after.isdigit():
+        return min(float(retry_after), RETRY_MAX_BACKOFF)
+    return _backoff_delay(attempt, RETRY_BACKOFF_FACTOR, RETRY_MAX_BACKOFF)
+
+
+def _decode_json(content: Union[bytes, str]) -> Any:
+    """Parse a JSON document, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _raise_for_status(response: Any) -> None:
+    """Raise ThroomAPIError if the gateway returned an error status code
+
+    Works with both requests and httpx responses.
+    """
+    if response.status_code < 400:
+        return
+    # Only JSON bodies are worth decoding; proxies in front of the gateway may
+    # answer with an HTML error page, which is truncated instead
+    message = None
+    if "json" in response.headers.get("content-type", ""):
+        try:
+            error_data = _decode_json(response.content)
+        except ValueError:
+            error_data = None
+        if isinstance(error_data, dict):
+            message = error_data.get("message") or error_data.get("error")
+    if not message:
+        message = response.text[:ERROR_TEXT_LIMIT]
+    raise ThroomAPIError(
+        f"Throome API Error ({response.status_code}): {message}",
+        status_code=response.status_code,
+    )
+
+
+def _handle_response(response: Any) -> Any:
+    """Decode a gateway response, raising ThroomAPIError on error status codes"""
+    _raise_for_status(response)
+    content = response.content
+    if not content:
+        return None
+    try:
+        return _decode_json(content)
+    except ValueError as e:
+        raise ThroomAPIError(
+            f"Invalid JSON in gateway response: {e}", status_code=response.status_code
+        )
+
+
+def _row_from_event(line: Any) -> Optional[Dict[str, Any]]:
+    """
+    Decode one line of a streamed query response
+
+    Returns None for the marker ending a complete result set, and raises if the
+    gateway reported an error.
+    """
+    event = _decode_json(line)
+    if event.get("error"):
+        # Mirrors the status /db/query returns when reading rows fails
+        raise ThroomAPIError(f"Throome API Error (500): {event['error']}", status_code=500)
+    if event.get("done"):
+        return None
+    return event["row"]
+
+
+def _cluster_from_dict(data: Dict[str, Any]) -> Cluster:
+    """Build a Cluster from its JSON representation"""
+    return Cluster(
+        id=data["id"],
+        name=data["name"],
+        created_at=data["created_at"],
+        services=[Service(**s) for s in data.get("services") or ()],
+    )
+
+
+def _clusters_from_list(data: Optional[List[Dict[str, Any]]]) -> List[Cluster]:
+    """Build Clusters from a JSON array, binding the constructors locally for speed"""
+    S, C = Service, Cluster
+    return [
+        C(
+            id=c["id"],
+            name=c["name"],
+            created_at=c["created_at"],
+            services=[S(**s) for s in c.get("services") or ()],
+        )
+        for c in data or ()
+    ]
+
+
+def _activity_from_list(data: Optional[List[Dict[str, Any]]]) -> List[ActivityLog]:
+    """Build ActivityLogs from a JSON array"""
+    A = ActivityLog
+    return [A(**log) for log in data or ()]
+
+
+def _cluster_health_from_dict(data: Dict[str, Any]) -> ClusterHealthResponse:
+    """Build a ClusterHealthResponse from its JSON representation"""
+    return ClusterHealthResponse(
+        cluster_id=data["cluster_id"],
+        services={k: ServiceHealth(**v) for k, v in data["services"].items()},
+    )
+
+
+def _services_payload(services: Dict[str, ServiceConfig]) -> Dict[str, Dict[str, Any]]:
+    """Build the services section of a create-cluster request, omitting unset fields"""
+    return {
+        name: {k: v for k, v in asdict(config).items() if v is not None}
+        for name, config in services.items()
+    }
+
+
+def _activity_params(filters: Optional[ActivityFilters]) -> Optional[Dict[str, Any]]:
+    """Build query parameters for activity endpoints"""
+    return {"limit": filters.limit} if filters and filters.limit else None
+
+
+def _log_params(options: Optional[LogOptions]) -> Dict[str, Any]:
+    """Build query parameters for the service logs endpoint"""
+    params: Dict[str, Any] = {}
+    if options:
+        if options.tail:
+            params["tail"] = options.tail
+        if options.timestamps:
+            params["timestamps"] = "true"
+    return params
+
+
+def _ttl_cache(method: F) -> F:
+    """
+    Memoize a client method for ``self.topology_cache_ttl`` seconds
+
+    Results are keyed on the method name and arguments and stored in the
+    client's ``_cache`` dict, which ``invalidate_cache()`` clears. List results are
+    handed out as shallow copies so one caller reordering them does not affect
+    the next. Works for both plain and ``async`` methods.
+    """
+
+    def lookup(self: Any, key: Any) -> Any:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return _MISSING
+
+    def store(self: Any, key: Any, value: Any) -> None:
+        if self.topology_cache_ttl > 0:
+            now = time.monotonic()
+            with self._cache_lock:
+                # Drop expired entries so per-cluster keys don't pile up
+                for stale in [k for k, (expires, _) in self._cache.items() if expires <= now]:
+                    del self._cache[stale]
+                self._cache[key] = (now + self.topology_cache_ttl, value)
+
+    def copy(value: Any) -> Any:
+        return list(value) if isinstance(value, list) else value
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            key = (method.__name__, args, frozenset(kwargs.items()))
+            value = lookup(self, key)
+            if value is _MISSING:
+                value = await method(self, *args, **kwargs)
+                store(self, key, value)
+            return copy(value)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        key = (method.__name__, args, frozenset(kwargs.items()))
+        value = lookup(self, key)
+        if value is _MISSING:
+            value = method(self, *args, **kwargs)
+            store(self, key, value)
+        return copy(value)
+
+    return wrapper  # type: ignore[return-value]
+
+
+class _CircuitBreaker:
+    """
+    Tracks consecutive gateway outages for one client
+
+    After ``failure_threshold`` failures in a row the breaker opens and calls fail
+    fast. Once ``reset_timeout`` seconds pass a single trial call is let through;
+    its outcome closes the breaker or keeps it open for another period.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """Raise ThroomConnectionError if the breaker is open"""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            now = time.monotonic()
+            if now - self._opened_at < self.reset_timeout:
+                raise ThroomConnectionError(
+                    "Circuit breaker open: gateway unavailable after "
+                    f"{self._failures} consecutive failures"
+                )
+            # Let this call through as the trial and keep failing fast for the others
+            self._opened_at = now
+
+    def record(self, error: Optional[BaseException] = None) -> None:
+        """Record the outcome of a call; only outages count as failures"""
+        outage = isinstance(error, ThroomConnectionError) or (
+            isinstance(error, ThroomAPIError) and error.status_code in OUTAGE_STATUSES
+        )
+        with self._lock:
+            if not outage:
+                self._failures = 0
+                self._opened_at = None
+                return
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+def _circuit_break(method: F) -> F:
+    """
+    Guard a client method with the client's ``_breaker``
+
+    While the breaker is open the call raises ThroomConnectionError without
+    touching the network. Works for both plain and ``async`` methods.
+    """
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            breaker = self._breaker
+            if breaker is None:
+                return await method(self, *args, **kwargs)
+            breaker.before_call()
+            try:
+                result = await method(self, *args, **kwargs)
+            except Exception as e:
+                breaker.record(e)
+                raise
+            breaker.record()
+            return result
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        breaker = self._breaker
+        if breaker is None:
+            return method(self, *args, **kwargs)
+        breaker.before_call()
+        try:
+            result = method(self, *args, **kwargs)
+        except Exception as e:
+            breaker.record(e)
+            raise
+        breaker.record()
+        return result
+
+    return wrapper  # type: ignore[return-value]
 
 
 class ThroomClient:
     """Main Throome SDK client"""
 
-    def __init__(self, base_url: str, timeout: int = 120):
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 120,
+        session: Optional["requests.Session"] = None,
+        pool_size: Optional[int] = None,
+        topology_cache_ttl: float = 2.0,
+        circuit_breaker_threshold: int = 5,
+        circuit_breaker_reset: float = 30.0,
+    ):
         """
         Initialize Throome client
 
         Args:
             base_url: Base URL of the Throome Gateway
             timeout: Request timeout in seconds (default: 120)
+            session: Preconfigured requests session to use instead of creating one. Its
+                headers are not modified.
+            pool_size: Connections kept alive per host (default: 8 per CPU, at least 32).
+                Ignored when a session is passed in.
+            topology_cache_ttl: Seconds to cache list_clusters/get_cluster results
+                (default: 2.0, 0 disables caching)
+            circuit_breaker_threshold: Consecutive gateway outages after which calls fail
+                fast instead of hitting the network (default: 5, 0 disables the breaker)
+            circuit_breaker_reset: Seconds to fail fast before letting a trial call through
+                (default: 30.0)
         """
+        # requests (with urllib3, idna and charset detection) dominates the SDK's
+        # import time, so it is only loaded once a client is created
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.exceptions import MaxRetryError
+        from urllib3.util.retry import Retry
+
+        self._requests = requests
+        self._max_retry_error = MaxRetryError
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
+        if session is None:
+            session = requests.Session()
+            pool = pool_size or _default_pool_size()
+            # The default adapter only keeps 10 connections per host, so concurrent
+            # callers beyond that would reconnect on every request.
+            adapter = HTTPAdapter(
+                pool_connections=pool,
+                pool_maxsize=pool,
+                # The adapter only retries failures to connect, for every method since
+                # nothing was sent. Read failures and retryable statuses are left to
+                # _request, which knows whether the call is idempotent.
+                max_retries=Retry(
+                    total=RETRY_TOTAL,
+                    connect=RETRY_TOTAL,
+                    read=False,
+                    status=0,
+                    backoff_factor=RETRY_BACKOFF_FACTOR,
+                    respect_retry_after_header=False,
+                    raise_on_status=False,
+                ),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(DEFAULT_HEADERS)
+            self._headers: Dict[str, str] = {}
+        else:
+            # A caller's session may be shared with other code, so its headers are
+            # left alone and the SDK's are sent with each request instead
+            self._headers = DEFAULT_HEADERS
+        self._octet_stream_headers = {**self._headers, **OCTET_STREAM_HEADERS}
+        self.session = session
+        self.topology_cache_ttl = topology_cache_ttl
+        self._cache: Dict[Any, Any] = {}
+        self._cache_lock = threading.Lock()
+        self._breaker = (
+            _CircuitBreaker(circuit_breaker_threshold, circuit_breaker_reset)
+            if circuit_breaker_threshold > 0
+            else None
+        )
+
+    def invalidate_cache(self) -> None:
+        """Drop cached list_clusters/get_cluster results"""
+        with self._cache_lock:
+            self._cache.clear()
 
+    @_circuit_break
     def _request(
-        self, method: str, path: str, data: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None
+        self,
+        method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotent: bool = False,
+        content: Any = None,
     ) -> Any:
-        """Make an HTTP request to the gateway"""
-        url = f"{self.base_url}{path}"
-
-        try:
-            response = self.session.request(
-                method=method, url=url, json=data, params=params, timeout=self.timeout
-            )
+        """
+        Make an HTTP request to the gateway
 
-            if response.status_code >= 400:
-                error_data = response.json() if response.content else {}
-                message = error_data.get("message") or error_data.get("error") or response.text
-                raise ThroomAPIError(
-                    f"Throome API Error ({response.status_code}): {message}",
-                    status_code=response.status_code,
+        data is sent as JSON, or content as a raw application/octet-stream body.
+        Dropped connections, timeouts and retryable statuses are retried here for GET
+        and DELETE, and for a POST only when the caller marks it ``idempotent``.
+        Failures to connect are left to the session's adapter, so each failure is
+        retried by one layer.
+        """
+        requests = self._requests
+        url = f"{self.base_url}{path}"
+        if content is None:
+            body, headers = _encode_body(data), self._headers
+        else:
+            body, headers = content, self._octet_stream_headers
+        retry = idempotent or method in IDEMPOTENT_METHODS
+
+        for attempt in range(RETRY_TOTAL + 1):
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    data=body,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout,
                 )
-
-            if response.content:
-                return response.json()
-            return None
-
-        except Timeout as e:
-            raise ThroomConnectionError(f"Request timed out: {e}")
-        except RequestException as e:
-            raise ThroomConnectionError(f"Connection error: {e}")
+            except requests.exceptions.RequestException as e:
+                # The adapter wraps failures in MaxRetryError once it has given up
+                # retrying them; anything else failed after the request was sent
+                retried = bool(e.args) and isinstance(e.args[0], self._max_retry_error)
+                if not retry or attempt == RETRY_TOTAL or retried:
+                    if isinstance(e, requests.exceptions.Timeout):
+                        raise ThroomConnectionError(f"Request timed out: {e}")
+                    raise ThroomConnectionError(f"Connection error: {e}")
+                time.sleep(_retry_delay(attempt))
+                continue
+
+            if not retry or attempt == RETRY_TOTAL or response.status_code not in RETRY_STATUSES:
+                return _handle_response(response)
+            time.sleep(_retry_delay(attempt, response))
 
     def health(self) -> HealthResponse:
         """Get gateway health"""
         data = self._request("GET", "/api/v1/health")
         return HealthResponse(**data)
 
+    @_ttl_cache
     def list_clusters(self) -> List[Cluster]:
         """List all clusters"""
         data = self._request("GET", "/api/v1/clusters")
-        return [
-            Cluster(
-                id=c["id"],
-                name=c["name"],
-                created_at=c["created_at"],
-                services=[Service(**s) for s in c.get("services", [])],
-            )
-            for c in data
-        ]
+        return _clusters_from_list(data)
 
+    @_ttl_cache
     def get_cluster(self, cluster_id: str) -> Cluster:
         """Get a specific cluster"""
         data = self._request("GET", f"/api/v1/clusters/{cluster_id}")
-        return Cluster(
-            id=data["id"],
-            name=data["name"],
-            created_at=data["created_at"],
-            services=[Service(**s) for s in data.get("services", [])],
-        )
+        return _cluster_from_dict(data)
 
     def create_cluster(
         self, name: str, services: Dict[str, ServiceConfig]
     ) -> CreateClusterResponse:
         """Create a new cluster"""
-        services_dict = {
-            name: {
-                "type": config.type,
-                "port": config.port,
-                "host": config.host,
-                "username": config.username,
-                "password": config.password,
-                "database": config.database,
-            }
-            for name, config in services.items()
-        }
-        data = self._request("POST", "/api/v1/clusters", {"name": name, "services": services_dict})
+        data = self._request(
+            "POST", "/api/v1/clusters", {"name": name, "services": _services_payload(services)}
+        )
+        self.invalidate_cache()
         return CreateClusterResponse(**data)
 
     def delete_cluster(self, cluster_id: str) -> None:
         """Delete a cluster"""
         self._request("DELETE", f"/api/v1/clusters/{cluster_id}")
+        self.invalidate_cache()
 
     def get_activity(self, filters: Optional[ActivityFilters] = None) -> List[ActivityLog]:
         """Get global activity logs"""
-        params = {"limit": filters.limit} if filters and filters.limit else None
+        params = _activity_params(filters)
         data = self._request("GET", "/api/v1/activity", params=params)
-        return [ActivityLog(**log) for log in data]
+        return _activity_from_list(data)
 
     def cluster(self, cluster_id: str) -> "ClusterClient":
         """Get a cluster client for cluster-specific operations"""
@@ -133,27 +635,23 @@ class ClusterClient:
     def __init__(self, client: ThroomClient, cluster_id: str):
         self._client = client
         self.cluster_id = cluster_id
+        self._base = f"/api/v1/clusters/{cluster_id}"
 
     def health(self) -> ClusterHealthResponse:
         """Get cluster health"""
-        data = self._client._request("GET", f"/api/v1/clusters/{self.cluster_id}/health")
-        return ClusterHealthResponse(
-            cluster_id=data["cluster_id"],
-            services={k: ServiceHealth(**v) for k, v in data["services"].items()},
-        )
+        data = self._client._request("GET", self._base + "/health")
+        return _cluster_health_from_dict(data)
 
     def metrics(self) -> MetricsResponse:
         """Get cluster metrics"""
-        data = self._client._request("GET", f"/api/v1/clusters/{self.cluster_id}/metrics")
+        data = self._client._request("GET", self._base + "/metrics")
         return MetricsResponse(**data)
 
     def get_activity(self, filters: Optional[ActivityFilters] = None) -> List[ActivityLog]:
         """Get cluster activity logs"""
-        params = {"limit": filters.limit} if filters and filters.limit else None
-        data = self._client._request(
-            "GET", f"/api/v1/clusters/{self.cluster_id}/activity", params=params
-        )
-        return [ActivityLog(**log) for log in data]
+        params = _activity_params(filters)
+        data = self._client._request("GET", self._base + "/activity", params=params)
+        return _activity_from_list(data)
 
     def service(self, service_name: str) -> "ServiceClient":
         """Get a service client"""
@@ -179,41 +677,49 @@ class ServiceClient:
         self._client = client
         self.cluster_id = cluster_id
         self.service_name = service_name
+        self._base = f"/api/v1/clusters/{cluster_id}/services/{service_name}"
+        self._logs_url = client.base_url + self._base + "/logs"
 
     def get_info(self) -> ServiceInfo:
         """Get service information"""
-        data = self._client._request(
-            "GET", f"/api/v1/clusters/{self.cluster_id}/services/{self.service_name}"
-        )
+        data = self._client._request("GET", self._base)
         return ServiceInfo(**data)
 
     def get_logs(self, options: Optional[LogOptions] = None) -> str:
         """Get service Docker container logs"""
-        params = {}
-        if options:
-            if options.tail:
-                params["tail"] = options.tail
-            if options.timestamps:
-                params["timestamps"] = "true"
-
-        # Get logs as text
-        url = f"{self._client.base_url}/api/v1/clusters/{self.cluster_id}/services/{self.service_name}/logs"
+        return b"".join(self.get_logs_stream(options)).decode("utf-8", errors="replace")
+
+    def get_logs_stream(self, options: Optional[LogOptions] = None) -> Iterator[bytes]:
+        """
+        Stream service Docker container logs
+
+        Yields the raw log output in chunks as it is received, so large logs are
+        never held in memory at once.
+        """
+        params = _log_params(options)
+
         try:
-            response = self._client.session.get(url, params=params, timeout=self._client.timeout)
-            response.raise_for_status()
-            return response.text
-        except RequestException as e:
+            with self._client.session.get(
+                self._logs_url,
+                params=params,
+                headers=self._client._headers,
+                timeout=self._client.timeout,
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+                yield from response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+        except self._client._requests.exceptions.RequestException as e:
             raise ThroomConnectionError(f"Failed to get logs: {e}")
 
     def get_activity(self, filters: Optional[ActivityFilters] = None) -> List[ActivityLog]:
         """Get service activity logs"""
-        params = {"limit": filters.limit} if filters and filters.limit else None
+        params = _activity_params(filters)
         data = self._client._request(
             "GET",
-            f"/api/v1/clusters/{self.cluster_id}/services/{self.service_name}/activity",
+            self._base + "/activity",
             params=params,
         )
-        return [ActivityLog(**log) for log in data]
+        return _activity_from_list(data)
 
 
 class DBClient:
@@ -222,27 +728,66 @@ class DBClient:
     def __init__(self, client: ThroomClient, cluster_id: str):
         self._client = client
         self.cluster_id = cluster_id
+        self._base = f"/api/v1/clusters/{cluster_id}"
+        self._execute_path = self._base + "/db/execute"
+        self._query_path = self._base + "/db/query"
+        self._query_stream_url = client.base_url + self._base + "/db/query_stream"
 
     def execute(self, query: str, *args: Any) -> None:
         """Execute a SQL statement without returning results"""
         self._client._request(
             "POST",
-            f"/api/v1/clusters/{self.cluster_id}/db/execute",
-            {"query": query, "args": list(args)},
+            self._execute_path,
+            {"query": query, "args": args},
         )
 
-    def query(self, query: str, *args: Any) -> List[Dict[str, Any]]:
-        """Execute a SQL query and return results"""
+    def query(self, query: str, *args: Any, idempotent: bool = False) -> List[Dict[str, Any]]:
+        """
+        Execute a SQL query and return results
+
+        Pass ``idempotent=True`` for read-only queries to have them retried on
+        transient gateway failures. It is off by default because a query may write
+        (``INSERT ... RETURNING``, ``nextval()``) and may already have run.
+        """
         data = self._client._request(
             "POST",
-            f"/api/v1/clusters/{self.cluster_id}/db/query",
-            {"query": query, "args": list(args)},
+            self._query_path,
+            {"query": query, "args": args},
+            idempotent=idempotent,
         )
         return data["rows"]
 
-    def query_row(self, query: str, *args: Any) -> Dict[str, Any]:
+    def query_iter(self, query: str, *args: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a SQL query and yield rows as they arrive
+
+        Rows are streamed by the gateway as newline-delimited JSON, so memory use
+        stays flat no matter how large the result set is. If the stream ends before
+        the last row, ThroomConnectionError is raised rather than stopping early.
+        """
+        try:
+            with self._client.session.post(
+                self._query_stream_url,
+                data=_encode_body({"query": query, "args": args}),
+                headers=self._client._headers,
+                timeout=self._client.timeout,
+                stream=True,
+            ) as response:
+                _raise_for_status(response)
+                for line in response.iter_lines(chunk_size=STREAM_CHUNK_SIZE):
+                    if line:
+                        row = _row_from_event(line)
+                        if row is None:
+                            return
+                        yield row
+        except self._client._requests.exceptions.RequestException as e:
+            raise ThroomConnectionError(f"Connection error: {e}")
+        # The gateway ends every complete result set with a marker
+        raise ThroomConnectionError("Connection error: query stream ended before the last row")
+
+    def query_row(self, query: str, *args: Any, idempotent: bool = False) -> Dict[str, Any]:
         """Execute a query that returns a single row"""
-        rows = self.query(query, *args)
+        rows = self.query(query, *args, idempotent=idempotent)
         if not rows:
             raise ValueError("No rows returned")
         return rows[0]
@@ -254,33 +799,61 @@ class CacheClient:
     def __init__(self, client: ThroomClient, cluster_id: str):
         self._client = client
         self.cluster_id = cluster_id
+        self._base = f"/api/v1/clusters/{cluster_id}"
+        self._get_path = self._base + "/cache/get"
+        self._set_path = self._base + "/cache/set"
+        self._delete_path = self._base + "/cache/delete"
+        # Bound once; cache calls are often issued in tight loops
+        self._request = client._request
 
     def get(self, key: str) -> str:
         """Get a value from cache"""
-        data = self._client._request(
-            "POST", f"/api/v1/clusters/{self.cluster_id}/cache/get", {"key": key}
-        )
+        data = self._request("POST", self._get_path, {"key": key}, idempotent=True)
         return data["value"]
 
-    def set(self, key: str, value: str, expiration: Optional[int] = None) -> None:
+    def set(self, key: str, value: str, expiration: int = 0) -> None:
         """
         Set a value in cache
 
         Args:
             key: Cache key
             value: Cache value
-            expiration: Expiration time in seconds
+            expiration: Expiration time in seconds (0 means no expiry)
         """
-        payload = {"key": key, "value": value}
-        if expiration is not None:
-            payload["expiration"] = expiration
-        self._client._request("POST", f"/api/v1/clusters/{self.cluster_id}/cache/set", payload)
+        self._request(
+            "POST",
+            self._set_path,
+            {"key": key, "value": value, "expiration": expiration},
+            idempotent=True,
+        )
 
     def delete(self, key: str) -> None:
         """Delete a key from cache"""
-        self._client._request(
-            "POST", f"/api/v1/clusters/{self.cluster_id}/cache/delete", {"key": key}
-        )
+        self._request("POST", self._delete_path, {"key": key}, idempotent=True)
+
+    def mset(self, items: Dict[str, str], expiration: int = 0) -> None:
+        """
+        Set multiple values in cache
+
+        The gateway has no batch endpoint, so keys are set concurrently over the
+        client's pooled connections.
+
+        Args:
+            items: Mapping of cache keys to values
+            expiration: Expiration time in seconds, applied to every key (0 means no expiry)
+        """
+        if not items:
+            return
+        with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(items))) as executor:
+            # list() re-raises the first failure
+            list(executor.map(lambda kv: self.set(kv[0], kv[1], expiration), items.items()))
+
+    def mdelete(self, keys: List[str]) -> None:
+        """Delete multiple keys from cache concurrently"""
+        if not keys:
+            return
+        with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(keys))) as executor:
+            list(executor.map(self.delete, keys))
 
 
 class QueueClient:
@@ -289,16 +862,79 @@ class QueueClient:
     def __init__(self, client: ThroomClient, cluster_id: str):
         self._client = client
         self.cluster_id = cluster_id
+        self._base = f"/api/v1/clusters/{cluster_id}"
+        self._publish_path = self._base + "/queue/publish"
+        self._subscribe_url = client.base_url + self._base + "/queue/subscribe"
+
+    def publish(self, topic: str, message: Message) -> None:
+        """
+        Publish a message to a topic
 
-    def publish(self, topic: str, message: bytes) -> None:
-        """Publish a message to a topic"""
+        The message may be bytes, a bytearray or memoryview, or a binary file-like
+        object. It is sent as the raw request body, so buffers are not copied and
+        files are streamed from their current position.
+        """
         self._client._request(
-            "POST",
-            f"/api/v1/clusters/{self.cluster_id}/queue/publish",
-            {"topic": topic, "message": list(message)},
+            "POST", self._publish_path, params={"topic": topic}, content=_message_body(message)
         )
 
-    def subscribe(self, topic: str, handler: Any) -> None:
-        """Subscribe to a topic (not yet implemented - use direct Kafka consumer)"""
-        raise NotImplementedError("Subscribe not yet implemented in SDK - use direct Kafka consumer")
+    def subscribe(
+        self, topic: str, handler: Callable[[bytes], Any], group: Optional[str] = None
+    ) -> None:
+        """
+        Subscribe to a topic, calling handler with each message as it arrives
+
+        The gateway pushes messages over one long-lived server-sent events stream.
+        Dropped connections are re-established with exponential backoff, so this
+        blocks until handler raises.
+
+        Args:
+            topic: Topic to consume
+            handler: Called with the raw bytes of every message
+            group: Kafka consumer group to join. Offsets are committed only for a named
+                group, so it resumes where it left off after a reconnect. By default every
+                connection gets a fresh, uncommitted group and only sees messages
+                published after it connects.
+        """
+        params = {"topic": topic}
+        if group:
+            params["group"] = group
+        headers = {**self._client._headers, "Accept": "text/event-stream"}
+
+        attempt = 0
+        while True:
+            try:
+                response = self._client.session.get(
+                    self._subscribe_url,
+                    params=params,
+                    headers=headers,
+                    timeout=self._client.timeout,
+                    stream=True,
+                )
+            except self._client._requests.exceptions.RequestException:
+                response = None
+
+            # Only connection failures and 5xx reconnect; errors from handler propagate
+            if response is not None:
+                with response:
+                    if response.status_code < 500:
+                        _raise_for_status(response)
+                        attempt = 0
+                        response.encoding = "utf-8"
+                        for message in self._messages(response):
+                            handler(message)
+
+            time.sleep(_backoff_delay(attempt, SUBSCRIBE_BASE_BACKOFF, SUBSCRIBE_MAX_BACKOFF))
+            attempt += 1
+
+    def _messages(self, response: "requests.Response") -> Iterator[bytes]:
+        """Yield messages from a subscribe stream until the connection drops"""
+        parser = _SSEParser()
+        try:
+            for line in response.iter_lines(decode_unicode=True):
+                data = parser.feed(line)
+                if data is not None:
+                    yield base64.b64decode(_decode_json(data)["value"])
+        except self._client._requests.exceptions.RequestException:
+            return
 
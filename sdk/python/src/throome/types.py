@@ -1,11 +1,37 @@
 """Throome SDK types"""
 
+import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
+try:
+    from ciso8601 import parse_datetime as _fast_parse_datetime
+except ImportError:  # ciso8601 is optional, see the "fast" extra
+    _fast_parse_datetime = None  # type: ignore[assignment]
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__; slots= needs Python 3.10+
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_FRACTION_RE = re.compile(r"\.(\d+)")
+
+
+def _parse_datetime(value: Union[str, datetime]) -> datetime:
+    """Parse an RFC 3339 timestamp as sent by the gateway"""
+    if isinstance(value, datetime):
+        return value
+    if _fast_parse_datetime is not None:
+        return _fast_parse_datetime(value)
+    # Go emits a "Z" suffix and up to 9 fractional digits, neither of which
+    # datetime.fromisoformat accepts before Python 3.11
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    value = _FRACTION_RE.sub(lambda m: "." + m.group(1)[:6].ljust(6, "0"), value, count=1)
+    return datetime.fromisoformat(value)
+
+
+@dataclass(**_SLOTS)
 class Service:
     """Service information"""
 
@@ -19,17 +45,20 @@ class Service:
     container_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Cluster:
     """Cluster information"""
 
     id: str
     name: str
-    created_at: str
+    created_at: datetime
     services: List[Service] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        self.created_at = _parse_datetime(self.created_at)
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class ServiceConfig:
     """Service configuration for cluster creation"""
 
@@ -42,7 +71,7 @@ class ServiceConfig:
     database: Optional[str] = None  # Required for databases when provision is False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CreateClusterRequest:
     """Request to create a cluster"""
 
@@ -50,7 +79,7 @@ class CreateClusterRequest:
     services: Dict[str, ServiceConfig]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CreateClusterResponse:
     """Response from creating a cluster"""
 
@@ -58,7 +87,7 @@ class CreateClusterResponse:
     message: str
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class HealthResponse:
     """Gateway health response"""
 
@@ -66,7 +95,7 @@ class HealthResponse:
     timestamp: int
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ServiceHealth:
     """Service health status"""
 
@@ -75,7 +104,7 @@ class ServiceHealth:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ClusterHealthResponse:
     """Cluster health response"""
 
@@ -83,7 +112,7 @@ class ClusterHealthResponse:
     services: Dict[str, ServiceHealth]
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class MetricsResponse:
     """Cluster metrics"""
 
@@ -94,7 +123,7 @@ class MetricsResponse:
     active_services: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ServiceInfo:
     """Detailed service information"""
 
@@ -107,7 +136,7 @@ class ServiceInfo:
     status: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ActivityLog:
     """Activity log entry"""
 
@@ -125,15 +154,18 @@ class ActivityLog:
     error: Optional[str] = None
     client_info: Optional[Dict[str, str]] = None
 
+    def __post_init__(self) -> None:
+        self.timestamp = _parse_datetime(self.timestamp)
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class ActivityFilters:
     """Filters for activity logs"""
 
     limit: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LogOptions:
     """Options for fetching service logs"""
 
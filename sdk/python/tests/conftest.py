@@ -0,0 +1,168 @@
+"""Shared fixtures: a stub Throome gateway served over real HTTP"""
+
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import pytest
+
+import throome.async_client
+import throome.client
+
+
+class Reply(NamedTuple):
+    """A canned response"""
+
+    status: int
+    body: bytes = b""
+    headers: Dict[str, str] = {}
+
+
+class Recorded(NamedTuple):
+    """A request received by the stub"""
+
+    method: str
+    path: str
+    query: str
+    headers: Dict[str, str]
+    body: bytes
+
+
+# A route either answers with canned replies or writes the response itself
+Handler = Callable[[BaseHTTPRequestHandler, Recorded], None]
+
+
+def json_reply(status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> Reply:
+    """Build a JSON reply"""
+    return Reply(
+        status,
+        json.dumps(payload).encode(),
+        {"Content-Type": "application/json", **(headers or {})},
+    )
+
+
+def write_reply(http: BaseHTTPRequestHandler, reply: Reply) -> None:
+    """Send a canned reply from a route handler"""
+    http.send_response(reply.status)
+    for name, value in reply.headers.items():
+        http.send_header(name, value)
+    http.send_header("Content-Length", str(len(reply.body)))
+    http.end_headers()
+    http.wfile.write(reply.body)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # Batch helpers open dozens of connections at once; the default backlog of 5
+    # makes the kernel drop SYNs and the client wait a second to retry
+    request_queue_size = 128
+
+
+class StubGateway:
+    """
+    Serves canned replies per (method, path) and records every request
+
+    Replies registered for a route are handed out in order, and the last one
+    repeats once the others are used up.
+    """
+
+    def __init__(self) -> None:
+        self.requests: List[Recorded] = []
+        self._routes: Dict[Tuple[str, str], List[Union[Reply, Handler]]] = {}
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def route(self, method: str, path: str, *replies: Union[Reply, Handler]) -> None:
+        """Register the replies for a route"""
+        self._routes[(method, path)] = list(replies)
+
+    def hits(self, method: str, path: str) -> List[Recorded]:
+        """Requests received for a route"""
+        return [r for r in self.requests if r.method == method and r.path == path]
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _next_reply(self, request: Recorded) -> Union[Reply, Handler]:
+        with self._lock:
+            self.requests.append(request)
+            replies = self._routes.get((request.method, request.path))
+            if not replies:
+                return json_reply(404, {"error": "no stub route"})
+            return replies.pop(0) if len(replies) > 1 else replies[0]
+
+    def _handler_class(self) -> type:
+        stub = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _read_body(self) -> bytes:
+                if self.headers.get("Transfer-Encoding") == "chunked":
+                    body = b""
+                    while True:
+                        size = int(self.rfile.readline(), 16)
+                        if size == 0:
+                            self.rfile.readline()
+                            return body
+                        body += self.rfile.read(size)
+                        self.rfile.readline()
+                return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+            def _serve(self) -> None:
+                parts = urlsplit(self.path)
+                request = Recorded(
+                    self.command, parts.path, parts.query, dict(self.headers), self._read_body()
+                )
+                reply = stub._next_reply(request)
+                if callable(reply):
+                    reply(self, request)
+                else:
+                    write_reply(self, reply)
+
+            do_GET = do_POST = do_DELETE = _serve
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return _Handler
+
+
+@pytest.fixture
+def gateway() -> Iterator[StubGateway]:
+    stub = StubGateway()
+    stub.start()
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def refused_url() -> str:
+    """URL of a local port nothing listens on"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+@pytest.fixture
+def no_retry_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make retries immediate, both in _request and in the session's adapter"""
+    monkeypatch.setattr(throome.client, "RETRY_BACKOFF_FACTOR", 0)
+    monkeypatch.setattr(throome.client, "_retry_delay", lambda attempt, response=None: 0)
+    monkeypatch.setattr(throome.async_client, "_retry_delay", lambda attempt, response=None: 0)
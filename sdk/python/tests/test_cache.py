@@ -0,0 +1,206 @@
+"""Cache calls and the mset/mdelete batch helpers"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+import throome.async_client
+import throome.client
+from throome import ThroomAPIError, ThroomClient
+
+from conftest import json_reply, write_reply
+
+SET = "/api/v1/clusters/c1/cache/set"
+DELETE = "/api/v1/clusters/c1/cache/delete"
+OK = json_reply(200, {"status": "success"})
+
+
+def failing_key(key):
+    """A route handler failing the request for one key with a 500"""
+
+    def handler(http, request):
+        failed = json.loads(request.body)["key"] == key
+        write_reply(http, json_reply(500, {"error": f"failed {key}"}) if failed else OK)
+
+    return handler
+
+
+class InFlight:
+    """A route handler recording the most requests it was serving at once"""
+
+    def __init__(self):
+        self.current = self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, http, request):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        time.sleep(0.02)
+        with self._lock:
+            self.current -= 1
+        write_reply(http, OK)
+
+
+@pytest.fixture
+def batch_limit(monkeypatch):
+    monkeypatch.setattr(throome.client, "BATCH_MAX_WORKERS", 3)
+    monkeypatch.setattr(throome.async_client, "BATCH_MAX_WORKERS", 3)
+    return 3
+
+
+def sent(gateway, path):
+    return [json.loads(hit.body) for hit in gateway.hits("POST", path)]
+
+
+@pytest.fixture
+def cache(gateway):
+    return ThroomClient(gateway.url).cluster("c1").cache()
+
+
+def test_set_always_sends_expiration(cache, gateway):
+    gateway.route("POST", SET, OK)
+
+    cache.set("a", "1")
+    cache.set("b", "2", expiration=60)
+    cache.set("c", "3", expiration=None)
+    cache.mset({"d": "4"})
+
+    assert sent(gateway, SET) == [
+        {"key": "a", "value": "1", "expiration": 0},
+        {"key": "b", "value": "2", "expiration": 60},
+        {"key": "c", "value": "3", "expiration": None},
+        {"key": "d", "value": "4", "expiration": 0},
+    ]
+
+
+def test_mset_sets_every_key(cache, gateway):
+    gateway.route("POST", SET, OK)
+    items = {f"k{i}": f"v{i}" for i in range(50)}
+
+    cache.mset(items, expiration=60)
+
+    bodies = sorted(sent(gateway, SET), key=lambda body: int(body["key"][1:]))
+    assert bodies == [{"key": k, "value": v, "expiration": 60} for k, v in items.items()]
+
+
+def test_mdelete_deletes_every_key(cache, gateway):
+    gateway.route("POST", DELETE, OK)
+    keys = [f"k{i}" for i in range(50)]
+
+    cache.mdelete(keys)
+
+    assert sorted(body["key"] for body in sent(gateway, DELETE)) == sorted(keys)
+
+
+def test_batches_reraise_the_first_failure(cache, gateway):
+    gateway.route("POST", SET, failing_key("k3"))
+    gateway.route("POST", DELETE, failing_key("k3"))
+    keys = [f"k{i}" for i in range(10)]
+
+    with pytest.raises(ThroomAPIError, match="failed k3"):
+        cache.mset(dict.fromkeys(keys, "v"))
+    with pytest.raises(ThroomAPIError, match="failed k3"):
+        cache.mdelete(keys)
+
+    # The other keys were still sent
+    assert len(gateway.hits("POST", SET)) == len(gateway.hits("POST", DELETE)) == 10
+
+
+def test_batches_bound_concurrency(cache, gateway, batch_limit):
+    in_flight = InFlight()
+    gateway.route("POST", SET, in_flight)
+
+    cache.mset({f"k{i}": "v" for i in range(12)})
+
+    assert 1 < in_flight.peak <= batch_limit
+
+
+def test_empty_batches_send_nothing(cache, gateway):
+    cache.mset({})
+    cache.mdelete([])
+
+    assert gateway.requests == []
+
+
+class TestAsync:
+    @pytest.fixture(autouse=True)
+    def _httpx(self):
+        pytest.importorskip("httpx")
+
+    def run(self, gateway, call):
+        from throome import AsyncThroomClient
+
+        async def main():
+            async with AsyncThroomClient(gateway.url) as client:
+                return await call(client.cluster("c1").cache())
+
+        return asyncio.run(main())
+
+    def test_set_always_sends_expiration(self, gateway):
+        gateway.route("POST", SET, OK)
+
+        async def sets(cache):
+            await cache.set("a", "1")
+            await cache.set("b", "2", expiration=60)
+
+        self.run(gateway, sets)
+
+        assert sent(gateway, SET) == [
+            {"key": "a", "value": "1", "expiration": 0},
+            {"key": "b", "value": "2", "expiration": 60},
+        ]
+
+    def test_batches_send_every_key(self, gateway):
+        gateway.route("POST", SET, OK)
+        gateway.route("POST", DELETE, OK)
+        items = {f"k{i}": f"v{i}" for i in range(50)}
+
+        async def batches(cache):
+            await cache.mset(items, expiration=60)
+            await cache.mdelete(list(items))
+
+        self.run(gateway, batches)
+
+        bodies = sorted(sent(gateway, SET), key=lambda body: int(body["key"][1:]))
+        assert bodies == [{"key": k, "value": v, "expiration": 60} for k, v in items.items()]
+        assert sorted(body["key"] for body in sent(gateway, DELETE)) == sorted(items)
+
+    def test_batches_reraise_the_first_failure(self, gateway):
+        gateway.route("POST", SET, failing_key("k3"))
+        gateway.route("POST", DELETE, failing_key("k3"))
+        keys = [f"k{i}" for i in range(10)]
+
+        with pytest.raises(ThroomAPIError, match="failed k3"):
+            self.run(gateway, lambda cache: cache.mset(dict.fromkeys(keys, "v")))
+        with pytest.raises(ThroomAPIError, match="failed k3"):
+            self.run(gateway, lambda cache: cache.mdelete(keys))
+
+        # Every key was still sent before the failure was raised
+        assert len(gateway.hits("POST", SET)) == len(gateway.hits("POST", DELETE)) == 10
+
+    def test_batches_bound_concurrency(self, gateway, batch_limit):
+        in_flight = InFlight()
+        gateway.route("POST", SET, in_flight)
+        gateway.route("POST", DELETE, in_flight)
+        keys = [f"k{i}" for i in range(12)]
+
+        async def batches(cache):
+            await cache.mset(dict.fromkeys(keys, "v"))
+            await cache.mdelete(keys)
+
+        self.run(gateway, batches)
+
+        assert 1 < in_flight.peak <= batch_limit
+        assert len(gateway.hits("POST", SET)) == len(gateway.hits("POST", DELETE)) == 12
+
+    def test_empty_batches_send_nothing(self, gateway):
+        async def batches(cache):
+            await cache.mset({})
+            await cache.mdelete([])
+
+        self.run(gateway, batches)
+        assert gateway.requests == []
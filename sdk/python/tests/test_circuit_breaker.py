@@ -0,0 +1,163 @@
+"""Circuit breaker: opening on outages, failing fast, and the half-open trial"""
+
+import asyncio
+import time
+
+import pytest
+
+from throome import ThroomAPIError, ThroomClient, ThroomConnectionError
+from throome.client import RETRY_TOTAL, _CircuitBreaker
+
+from conftest import json_reply
+
+HEALTH = "/api/v1/health"
+HEALTHY = json_reply(200, {"status": "healthy", "timestamp": 1})
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(time, "monotonic", fake)
+    return fake
+
+
+def outage():
+    return ThroomConnectionError("refused")
+
+
+def test_opens_after_threshold_consecutive_outages(clock):
+    breaker = _CircuitBreaker(failure_threshold=3, reset_timeout=30)
+
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record(outage())
+    breaker.before_call()  # still closed below the threshold
+    breaker.record(outage())
+
+    with pytest.raises(ThroomConnectionError, match="Circuit breaker open"):
+        breaker.before_call()
+
+
+def test_success_resets_the_count(clock):
+    breaker = _CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+    breaker.record(outage())
+    breaker.record()
+    breaker.record(outage())
+
+    breaker.before_call()
+
+
+@pytest.mark.parametrize(
+    "error, counts",
+    [
+        (ThroomConnectionError("refused"), True),
+        (ThroomAPIError("bad gateway", status_code=502), True),
+        (ThroomAPIError("unavailable", status_code=503), True),
+        (ThroomAPIError("timeout", status_code=504), True),
+        (ThroomAPIError("rate limited", status_code=429), False),
+        (ThroomAPIError("server error", status_code=500), False),
+        (ThroomAPIError("not found", status_code=404), False),
+        (ValueError("handler bug"), False),
+    ],
+)
+def test_only_outages_count(clock, error, counts):
+    breaker = _CircuitBreaker(failure_threshold=1, reset_timeout=30)
+
+    breaker.record(error)
+
+    if counts:
+        with pytest.raises(ThroomConnectionError):
+            breaker.before_call()
+    else:
+        breaker.before_call()
+
+
+def test_half_open_lets_one_trial_through(clock):
+    breaker = _CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record(outage())
+
+    clock.now += 29
+    with pytest.raises(ThroomConnectionError):
+        breaker.before_call()
+
+    clock.now += 1
+    breaker.before_call()  # the trial
+    with pytest.raises(ThroomConnectionError):
+        breaker.before_call()  # others keep failing fast while it runs
+
+
+def test_successful_trial_closes(clock):
+    breaker = _CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record(outage())
+    clock.now += 30
+
+    breaker.before_call()
+    breaker.record()
+
+    breaker.before_call()
+    breaker.before_call()
+
+
+def test_failed_trial_reopens_for_another_period(clock):
+    breaker = _CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record(outage())
+    clock.now += 30
+
+    breaker.before_call()
+    breaker.record(outage())
+
+    clock.now += 29
+    with pytest.raises(ThroomConnectionError):
+        breaker.before_call()
+    clock.now += 1
+    breaker.before_call()
+
+
+def test_client_fails_fast_without_touching_the_network(gateway, no_retry_sleep):
+    client = ThroomClient(gateway.url, circuit_breaker_threshold=2, circuit_breaker_reset=0.2)
+    gateway.route("GET", HEALTH, json_reply(503, {"error": "unavailable"}))
+
+    for _ in range(2):
+        with pytest.raises(ThroomAPIError):
+            client.health()
+    assert len(gateway.hits("GET", HEALTH)) == 2 * (RETRY_TOTAL + 1)
+
+    with pytest.raises(ThroomConnectionError, match="Circuit breaker open"):
+        client.health()
+    assert len(gateway.hits("GET", HEALTH)) == 2 * (RETRY_TOTAL + 1)
+
+    gateway.route("GET", HEALTH, HEALTHY)
+    time.sleep(0.25)
+    assert client.health().status == "healthy"
+    assert client.health().status == "healthy"
+
+
+def test_disabled_with_zero_threshold(refused_url, no_retry_sleep):
+    client = ThroomClient(refused_url, circuit_breaker_threshold=0)
+
+    for _ in range(3):
+        with pytest.raises(ThroomConnectionError, match="Connection error"):
+            client.health()
+
+
+def test_async_client_fails_fast(refused_url, no_retry_sleep):
+    pytest.importorskip("httpx")
+    from throome import AsyncThroomClient
+
+    async def main():
+        async with AsyncThroomClient(refused_url, circuit_breaker_threshold=1) as client:
+            with pytest.raises(ThroomConnectionError, match="Connection error"):
+                await client.health()
+            with pytest.raises(ThroomConnectionError, match="Circuit breaker open"):
+                await client.health()
+
+    asyncio.run(main())
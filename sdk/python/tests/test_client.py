@@ -0,0 +1,245 @@
+"""ThroomClient calls against the stub gateway"""
+
+import asyncio
+import enum
+import gzip
+import json
+import time
+import uuid
+from datetime import date, datetime, timezone
+
+import pytest
+
+import throome.client
+from throome import ThroomAPIError, ThroomClient, ThroomError, __version__
+from throome.client import ERROR_TEXT_LIMIT, _encode_body
+from throome.types import ServiceConfig
+
+from conftest import Reply, json_reply
+
+CLUSTERS = "/api/v1/clusters"
+HEALTH = "/api/v1/health"
+
+
+def cluster_json(cluster_id):
+    return {
+        "id": cluster_id,
+        "name": cluster_id,
+        "created_at": "2024-01-02T03:04:05.123456789Z",
+        "services": None,
+    }
+
+
+@pytest.fixture
+def client(gateway):
+    return ThroomClient(gateway.url, topology_cache_ttl=0.2)
+
+
+def test_list_clusters_cached_within_ttl(client, gateway):
+    gateway.route("GET", CLUSTERS, json_reply(200, [cluster_json("c1"), cluster_json("c2")]))
+
+    assert [c.id for c in client.list_clusters()] == ["c1", "c2"]
+    assert [c.id for c in client.list_clusters()] == ["c1", "c2"]
+    assert len(gateway.hits("GET", CLUSTERS)) == 1
+
+    time.sleep(0.25)
+    client.list_clusters()
+    assert len(gateway.hits("GET", CLUSTERS)) == 2
+
+
+def test_cached_lists_are_copies(client, gateway):
+    gateway.route("GET", CLUSTERS, json_reply(200, [cluster_json("c1"), cluster_json("c2")]))
+
+    first = client.list_clusters()
+    first.pop()
+    first.reverse()
+
+    assert [c.id for c in client.list_clusters()] == ["c1", "c2"]
+
+
+def test_expired_entries_pruned(client, gateway):
+    gateway.route("GET", CLUSTERS + "/c1", json_reply(200, cluster_json("c1")))
+    gateway.route("GET", CLUSTERS + "/c2", json_reply(200, cluster_json("c2")))
+
+    client.get_cluster("c1")
+    time.sleep(0.25)
+    client.get_cluster("c2")
+
+    assert list(client._cache) == [("get_cluster", ("c2",), frozenset())]
+
+
+def test_writes_invalidate_cache(client, gateway):
+    gateway.route("GET", CLUSTERS, json_reply(200, []))
+    gateway.route("DELETE", CLUSTERS + "/c1", Reply(204))
+
+    client.list_clusters()
+    client.delete_cluster("c1")
+    client.list_clusters()
+
+    assert len(gateway.hits("GET", CLUSTERS)) == 2
+
+
+def test_json_error_message_extracted(client, gateway):
+    gateway.route("GET", CLUSTERS + "/nope", json_reply(404, {"error": "Cluster not found"}))
+
+    with pytest.raises(ThroomAPIError) as excinfo:
+        client.get_cluster("nope")
+    assert excinfo.value.status_code == 404
+    assert str(excinfo.value) == "Throome API Error (404): Cluster not found"
+
+
+def test_non_json_error_body_truncated(client, gateway):
+    page = b"<html>" + b"x" * 10000 + b"</html>"
+    gateway.route("GET", CLUSTERS + "/c1", Reply(500, page, {"Content-Type": "text/html"}))
+
+    with pytest.raises(ThroomAPIError) as excinfo:
+        client.get_cluster("c1")
+    assert str(excinfo.value) == f"Throome API Error (500): {page[:ERROR_TEXT_LIMIT].decode()}"
+
+
+SERVICES = {
+    "cache": ServiceConfig(type="redis", provision=True, port=6379),
+    "db": ServiceConfig(
+        type="postgres",
+        provision=False,
+        port=5432,
+        host="db.internal",
+        username="app",
+        password="secret",
+        database="app",
+    ),
+}
+
+EXPECTED_SERVICES = {
+    "cache": {"type": "redis", "provision": True, "port": 6379},
+    "db": {
+        "type": "postgres",
+        "provision": False,
+        "port": 5432,
+        "host": "db.internal",
+        "username": "app",
+        "password": "secret",
+        "database": "app",
+    },
+}
+
+CREATED = json_reply(201, {"cluster_id": "c1", "message": "created"})
+
+
+def test_create_cluster_omits_unset_fields(client, gateway):
+    gateway.route("POST", CLUSTERS, CREATED)
+
+    assert client.create_cluster("demo", SERVICES).cluster_id == "c1"
+
+    body = json.loads(gateway.hits("POST", CLUSTERS)[0].body)
+    assert body == {"name": "demo", "services": EXPECTED_SERVICES}
+
+
+def test_async_create_cluster_omits_unset_fields(gateway):
+    pytest.importorskip("httpx")
+    from throome import AsyncThroomClient
+
+    gateway.route("POST", CLUSTERS, CREATED)
+
+    async def main():
+        async with AsyncThroomClient(gateway.url) as client:
+            return await client.create_cluster("demo", SERVICES)
+
+    assert asyncio.run(main()).cluster_id == "c1"
+    body = json.loads(gateway.hits("POST", CLUSTERS)[0].body)
+    assert body == {"name": "demo", "services": EXPECTED_SERVICES}
+
+
+def gzipped_health():
+    body = gzip.compress(json.dumps({"status": "healthy", "timestamp": 1}).encode())
+    return Reply(200, body, {"Content-Type": "application/json", "Content-Encoding": "gzip"})
+
+
+def assert_default_headers(hit):
+    assert hit.headers["User-Agent"] == f"throome-python/{__version__}"
+    assert "gzip" in hit.headers["Accept-Encoding"]
+
+
+def test_default_headers_and_gzip_responses(client, gateway):
+    gateway.route("GET", HEALTH, gzipped_health())
+
+    assert client.health().status == "healthy"
+    assert_default_headers(gateway.hits("GET", HEALTH)[0])
+
+
+def test_async_default_headers_and_gzip_responses(gateway):
+    pytest.importorskip("httpx")
+    from throome import AsyncThroomClient
+
+    gateway.route("GET", HEALTH, gzipped_health())
+
+    async def main():
+        async with AsyncThroomClient(gateway.url) as client:
+            return await client.health()
+
+    assert asyncio.run(main()).status == "healthy"
+    assert_default_headers(gateway.hits("GET", HEALTH)[0])
+
+
+def test_injected_session_headers_left_alone(gateway):
+    import requests
+
+    session = requests.Session()
+    session.headers["User-Agent"] = "myapp/1"
+    before = dict(session.headers)
+    gateway.route("GET", HEALTH, gzipped_health())
+    gateway.route("POST", CLUSTERS, CREATED)
+    client = ThroomClient(gateway.url, session=session)
+
+    client.health()
+    client.create_cluster("demo", SERVICES)
+
+    assert dict(session.headers) == before
+    health, create = gateway.hits("GET", HEALTH)[0], gateway.hits("POST", CLUSTERS)[0]
+    assert_default_headers(health)
+    assert_default_headers(create)
+    assert create.headers["Content-Type"] == "application/json"
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def encoder(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(throome.client, "orjson", None)
+    elif throome.client.orjson is None:
+        pytest.skip("orjson not installed")
+    return _encode_body
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        ({"n": 2**70}, {"n": 2**70}),
+        ({1: "a", None: "b"}, {"1": "a", "null": "b"}),
+        ({"d": date(2024, 1, 2)}, {"d": "2024-01-02"}),
+        (
+            {"t": datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc)},
+            {"t": "2024-01-02T03:04:05.000006+00:00"},
+        ),
+        ({"u": uuid.UUID(int=1)}, {"u": "00000000-0000-0000-0000-000000000001"}),
+        ({"c": Color.RED}, {"c": "red"}),
+        ({"args": ("x", 1)}, {"args": ["x", 1]}),
+    ],
+)
+def test_encoders_accept_the_same_bodies(encoder, data, expected):
+    assert json.loads(encoder(data)) == expected
+
+
+def test_encoders_raise_throome_error(encoder):
+    with pytest.raises(ThroomError, match="not JSON serializable"):
+        encoder({"x": object()})
+
+
+def test_unserializable_args_fail_before_sending(client, gateway):
+    with pytest.raises(ThroomError, match="not JSON serializable"):
+        client.cluster("c1").db().execute("SELECT $1", object())
+
+    assert gateway.requests == []
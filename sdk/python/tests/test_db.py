@@ -0,0 +1,104 @@
+"""Streamed database queries"""
+
+import asyncio
+import json
+
+import pytest
+
+from throome import ThroomAPIError, ThroomClient, ThroomConnectionError
+
+from conftest import Reply
+
+QUERY_STREAM = "/api/v1/clusters/c1/db/query_stream"
+
+
+DONE = {"done": True}
+
+
+def ndjson(*events):
+    body = "".join(json.dumps(event) + "\n" for event in events).encode()
+    return Reply(200, body, {"Content-Type": "application/x-ndjson"})
+
+
+@pytest.fixture
+def db(gateway):
+    return ThroomClient(gateway.url).cluster("c1").db()
+
+
+def test_query_iter_yields_rows(db, gateway):
+    gateway.route("POST", QUERY_STREAM, ndjson({"row": {"id": 1}}, {"row": {"id": 2}}, DONE))
+
+    rows = db.query_iter("SELECT id FROM t WHERE id > $1", 0)
+
+    assert list(rows) == [{"id": 1}, {"id": 2}]
+    body = json.loads(gateway.hits("POST", QUERY_STREAM)[0].body)
+    assert body == {"query": "SELECT id FROM t WHERE id > $1", "args": [0]}
+
+
+def test_query_iter_raises_mid_stream_errors(db, gateway):
+    gateway.route("POST", QUERY_STREAM, ndjson({"row": {"id": 1}}, {"error": "connection lost"}))
+    rows = db.query_iter("SELECT id FROM t")
+
+    assert next(rows) == {"id": 1}
+    with pytest.raises(ThroomAPIError, match="connection lost"):
+        next(rows)
+
+
+def test_query_iter_yields_nothing_for_empty_results(db, gateway):
+    gateway.route("POST", QUERY_STREAM, ndjson(DONE))
+
+    assert list(db.query_iter("SELECT id FROM t")) == []
+
+
+def test_query_iter_raises_row_encoding_errors(db, gateway):
+    error = {"error": "Failed to encode row: json: unsupported value: NaN"}
+    gateway.route("POST", QUERY_STREAM, ndjson({"row": {"x": 1.5}}, error))
+
+    with pytest.raises(ThroomAPIError, match="unsupported value: NaN"):
+        list(db.query_iter("SELECT x FROM t"))
+
+
+def test_query_iter_raises_when_stream_ends_early(db, gateway):
+    gateway.route("POST", QUERY_STREAM, ndjson({"row": {"id": 1}}))
+    rows = db.query_iter("SELECT id FROM t")
+
+    assert next(rows) == {"id": 1}
+    with pytest.raises(ThroomConnectionError, match="ended before the last row"):
+        next(rows)
+
+
+def test_async_query_iter_yields_rows(gateway):
+    pytest.importorskip("httpx")
+    from throome import AsyncThroomClient
+
+    gateway.route("POST", QUERY_STREAM, ndjson({"row": {"id": 1}}, {"error": "connection lost"}))
+    rows = []
+
+    async def main():
+        async with AsyncThroomClient(gateway.url) as client:
+            async for row in client.cluster("c1").db().query_iter("SELECT id FROM t"):
+                rows.append(row)
+
+    with pytest.raises(ThroomAPIError, match="connection lost"):
+        asyncio.run(main())
+    assert rows == [{"id": 1}]
+
+
+def test_async_query_iter_raises_when_stream_ends_early(gateway):
+    pytest.importorskip("httpx")
+    from throome import AsyncThroomClient
+
+    gateway.route("POST", QUERY_STREAM, ndjson({"row": {"id": 1}}, {"row": {"id": 2}}, DONE))
+    rows = []
+
+    async def main():
+        async with AsyncThroomClient(gateway.url) as client:
+            async for row in client.cluster("c1").db().query_iter("SELECT id FROM t"):
+                rows.append(row)
+            gateway.route("POST", QUERY_STREAM, ndjson({"row": {"id": 3}}))
+            async for row in client.cluster("c1").db().query_iter("SELECT id FROM t"):
+                rows.append(row)
+
+    with pytest.raises(ThroomConnectionError, match="ended before the last row"):
+        asyncio.run(main())
+    assert rows == [{"id": 1}, {"id": 2}, {"id": 3}]
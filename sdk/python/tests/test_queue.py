@@ -0,0 +1,212 @@
+"""Queue publish bodies and the server-sent events subscribe loop"""
+
+import array
+import asyncio
+import base64
+import io
+import json
+
+import pytest
+
+import throome.async_client
+import throome.client
+from throome import ThroomAPIError, ThroomClient
+from throome.client import STREAM_CHUNK_SIZE, _SSEParser
+
+from conftest import json_reply
+
+PUBLISH = "/api/v1/clusters/c1/queue/publish"
+SUBSCRIBE = "/api/v1/clusters/c1/queue/subscribe"
+PUBLISHED = json_reply(200, {"status": "success"})
+
+# Larger than one streamed chunk and not a multiple of 3
+PAYLOAD = bytes(range(256)) * (STREAM_CHUNK_SIZE // 256 * 3) + b"tail"
+
+
+class Stop(Exception):
+    """Raised by test handlers to end a subscription"""
+
+
+def feed_all(lines):
+    parser = _SSEParser()
+    return [data for data in map(parser.feed, lines) if data is not None]
+
+
+def test_sse_parser_joins_multi_line_data():
+    assert feed_all(["data: first", "data: second", "data:third", ""]) == ["first\nsecond\nthird"]
+
+
+def test_sse_parser_ignores_comments_and_other_fields():
+    lines = [": ping", "", "event: message", "id: 7", "data: {}", "retry: 10", ""]
+    assert feed_all(lines) == ["{}"]
+
+
+def test_sse_parser_keeps_events_apart():
+    assert feed_all(["data: a", "", "", "data: b", ""]) == ["a", "b"]
+
+
+def sse_stream(*values):
+    """A route handler streaming one event per value, then closing the connection"""
+
+    def handler(http, request):
+        http.send_response(200)
+        http.send_header("Content-Type", "text/event-stream")
+        http.send_header("Connection", "close")
+        http.end_headers()
+        http.wfile.write(b": ping\n\n")
+        for offset, value in enumerate(values):
+            event = {"topic": "orders", "value": base64.b64encode(value).decode(), "offset": offset}
+            # Split the JSON over two data lines to exercise multi-line events
+            text = json.dumps(event)
+            middle = text.index(",") + 1
+            http.wfile.write(f"data: {text[:middle]}\ndata: {text[middle:]}\n\n".encode())
+            http.wfile.flush()
+        http.close_connection = True
+
+    return handler
+
+
+@pytest.fixture
+def no_subscribe_backoff(monkeypatch):
+    monkeypatch.setattr(throome.client, "_backoff_delay", lambda *args: 0)
+    monkeypatch.setattr(throome.async_client, "_backoff_delay", lambda *args: 0)
+
+
+def collect_until(count):
+    received = []
+
+    def handler(message):
+        received.append(message)
+        if len(received) == count:
+            raise Stop
+
+    return received, handler
+
+
+def test_subscribe_reconnects_after_stream_ends(gateway, no_subscribe_backoff):
+    gateway.route("GET", SUBSCRIBE, sse_stream(b"a", b"b"))
+    queue = ThroomClient(gateway.url).cluster("c1").queue()
+    received, handler = collect_until(3)
+
+    with pytest.raises(Stop):
+        queue.subscribe("orders", handler, group="workers")
+
+    assert received == [b"a", b"b", b"a"]
+    hits = gateway.hits("GET", SUBSCRIBE)
+    assert len(hits) == 2
+    assert "group=workers" in hits[0].query
+
+
+def test_subscribe_reconnects_after_server_error(gateway, no_subscribe_backoff):
+    gateway.route("GET", SUBSCRIBE, json_reply(503, {"error": "down"}), sse_stream(b"a"))
+    queue = ThroomClient(gateway.url).cluster("c1").queue()
+    received, handler = collect_until(1)
+
+    with pytest.raises(Stop):
+        queue.subscribe("orders", handler)
+
+    assert received == [b"a"]
+
+
+def test_subscribe_raises_client_errors(gateway, no_subscribe_backoff):
+    gateway.route("GET", SUBSCRIBE, json_reply(404, {"error": "No Kafka service found"}))
+    queue = ThroomClient(gateway.url).cluster("c1").queue()
+
+    with pytest.raises(ThroomAPIError) as excinfo:
+        queue.subscribe("orders", lambda message: None)
+    assert excinfo.value.status_code == 404
+
+
+def test_subscribe_propagates_handler_errors_without_reconnecting(gateway, no_subscribe_backoff):
+    gateway.route("GET", SUBSCRIBE, sse_stream(b"a", b"b"))
+    queue = ThroomClient(gateway.url).cluster("c1").queue()
+
+    def handler(message):
+        # Looks like a gateway outage, but comes from the handler's own call
+        raise ThroomAPIError("unavailable", status_code=503)
+
+    with pytest.raises(ThroomAPIError):
+        queue.subscribe("orders", handler)
+    assert len(gateway.hits("GET", SUBSCRIBE)) == 1
+
+
+def published_bodies(gateway):
+    hits = gateway.hits("POST", PUBLISH)
+    for hit in hits:
+        assert hit.headers["Content-Type"] == "application/octet-stream"
+        assert hit.query == "topic=orders"
+    return [hit.body for hit in hits]
+
+
+def message_cases():
+    ints = array.array("i", [1, 2, 3])
+    return [
+        (b"bytes", b"bytes"),
+        (bytearray(b"bytearray"), b"bytearray"),
+        (memoryview(b"view"), b"view"),
+        (memoryview(b"s-t-r-i-d-e-d")[::2], b"strided"),
+        (memoryview(ints), ints.tobytes()),
+        (io.BytesIO(PAYLOAD), PAYLOAD),
+    ]
+
+
+def test_publish_sends_raw_bodies(gateway):
+    gateway.route("POST", PUBLISH, PUBLISHED)
+    queue = ThroomClient(gateway.url).cluster("c1").queue()
+    cases = message_cases()
+
+    for message, _ in cases:
+        queue.publish("orders", message)
+
+    assert published_bodies(gateway) == [expected for _, expected in cases]
+
+
+class TestAsync:
+    @pytest.fixture(autouse=True)
+    def _httpx(self):
+        pytest.importorskip("httpx")
+
+    def run(self, gateway, call):
+        from throome import AsyncThroomClient
+
+        async def main():
+            async with AsyncThroomClient(gateway.url) as client:
+                return await call(client.cluster("c1").queue())
+
+        return asyncio.run(main())
+
+    def test_publish_sends_raw_bodies(self, gateway):
+        gateway.route("POST", PUBLISH, PUBLISHED)
+        cases = message_cases()
+
+        async def publish_all(queue):
+            for message, _ in cases:
+                await queue.publish("orders", message)
+
+        self.run(gateway, publish_all)
+        assert published_bodies(gateway) == [expected for _, expected in cases]
+
+    def test_subscribe_awaits_coroutine_handlers(self, gateway, no_subscribe_backoff):
+        gateway.route("GET", SUBSCRIBE, json_reply(502, {"error": "down"}), sse_stream(b"a", b"b"))
+        received = []
+
+        async def handler(message):
+            received.append(message)
+            if len(received) == 2:
+                raise Stop
+
+        with pytest.raises(Stop):
+            self.run(gateway, lambda queue: queue.subscribe("orders", handler))
+        assert received == [b"a", b"b"]
+
+    def test_subscribe_propagates_handler_errors_without_reconnecting(
+        self, gateway, no_subscribe_backoff
+    ):
+        gateway.route("GET", SUBSCRIBE, sse_stream(b"a"))
+
+        def handler(message):
+            raise ThroomAPIError("unavailable", status_code=503)
+
+        with pytest.raises(ThroomAPIError):
+            self.run(gateway, lambda queue: queue.subscribe("orders", handler))
+        assert len(gateway.hits("GET", SUBSCRIBE)) == 1
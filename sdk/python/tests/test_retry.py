@@ -0,0 +1,261 @@
+"""Retry policy: which calls are retried, how often, and by which layer"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+import urllib3.connection
+
+from throome import ThroomAPIError, ThroomClient, ThroomConnectionError
+from throome.client import RETRY_MAX_BACKOFF, RETRY_TOTAL, _retry_delay
+
+from conftest import json_reply
+
+HEALTH = "/api/v1/health"
+CACHE_SET = "/api/v1/clusters/c1/cache/set"
+DB_EXECUTE = "/api/v1/clusters/c1/db/execute"
+DB_QUERY = "/api/v1/clusters/c1/db/query"
+
+UNAVAILABLE = json_reply(503, {"error": "unavailable"})
+HEALTHY = json_reply(200, {"status": "healthy", "timestamp": 1})
+CACHE_OK = json_reply(200, {"status": "ok"})
+
+
+def drop(http, request):
+    """Close the connection without answering, like a gateway restarting mid-request"""
+    http.close_connection = True
+
+
+def stall(http, request):
+    """Answer too late for a client with a short timeout"""
+    time.sleep(0.5)
+    http.close_connection = True
+
+
+@pytest.fixture
+def client(gateway, no_retry_sleep):
+    return ThroomClient(gateway.url, circuit_breaker_threshold=0)
+
+
+def test_get_retried_until_success(client, gateway):
+    gateway.route("GET", HEALTH, UNAVAILABLE, UNAVAILABLE, HEALTHY)
+
+    assert client.health().status == "healthy"
+    assert len(gateway.hits("GET", HEALTH)) == 3
+
+
+def test_get_gives_up_after_retry_budget(client, gateway):
+    gateway.route("GET", HEALTH, UNAVAILABLE)
+
+    with pytest.raises(ThroomAPIError) as excinfo:
+        client.health()
+    assert excinfo.value.status_code == 503
+    assert len(gateway.hits("GET", HEALTH)) == RETRY_TOTAL + 1
+
+
+def test_non_retryable_status_not_retried(client, gateway):
+    gateway.route("GET", HEALTH, json_reply(500, {"error": "boom"}))
+
+    with pytest.raises(ThroomAPIError):
+        client.health()
+    assert len(gateway.hits("GET", HEALTH)) == 1
+
+
+def test_non_idempotent_post_not_retried(client, gateway):
+    gateway.route("POST", DB_EXECUTE, UNAVAILABLE)
+
+    with pytest.raises(ThroomAPIError):
+        client.cluster("c1").db().execute("INSERT INTO t VALUES (1)")
+    assert len(gateway.hits("POST", DB_EXECUTE)) == 1
+
+
+def test_idempotent_post_retried(client, gateway):
+    gateway.route("POST", CACHE_SET, UNAVAILABLE, CACHE_OK)
+
+    client.cluster("c1").cache().set("k", "v")
+    assert len(gateway.hits("POST", CACHE_SET)) == 2
+
+
+def test_query_only_retried_when_marked_idempotent(client, gateway):
+    rows = json_reply(200, {"rows": [{"id": 1}]})
+    db = client.cluster("c1").db()
+
+    gateway.route("POST", DB_QUERY, UNAVAILABLE, rows)
+    with pytest.raises(ThroomAPIError):
+        db.query("INSERT INTO t VALUES (1) RETURNING id")
+    assert len(gateway.hits("POST", DB_QUERY)) == 1
+
+    gateway.route("POST", DB_QUERY, UNAVAILABLE, rows)
+    assert db.query("SELECT id FROM t", idempotent=True) == [{"id": 1}]
+    assert len(gateway.hits("POST", DB_QUERY)) == 3
+
+
+@pytest.mark.parametrize(
+    "method, path, call",
+    [
+        ("GET", HEALTH, lambda c: c.health()),
+        ("POST", CACHE_SET, lambda c: c.cluster("c1").cache().set("k", "v")),
+        ("POST", DB_QUERY, lambda c: c.cluster("c1").db().query("SELECT 1", idempotent=True)),
+    ],
+    ids=["get", "cache-set", "idempotent-query"],
+)
+@pytest.mark.parametrize("failure", [drop, stall], ids=["dropped", "timeout"])
+def test_read_failures_on_idempotent_calls_retried(
+    gateway, no_retry_sleep, failure, method, path, call
+):
+    gateway.route("GET", HEALTH, failure, HEALTHY)
+    gateway.route("POST", CACHE_SET, failure, CACHE_OK)
+    gateway.route("POST", DB_QUERY, failure, json_reply(200, {"rows": []}))
+    client = ThroomClient(gateway.url, timeout=0.2, circuit_breaker_threshold=0)
+
+    call(client)
+    assert len(gateway.hits(method, path)) == 2
+
+
+@pytest.mark.parametrize("failure", [drop, stall], ids=["dropped", "timeout"])
+def test_read_failures_on_non_idempotent_post_not_retried(gateway, no_retry_sleep, failure):
+    gateway.route("POST", DB_EXECUTE, failure, json_reply(200, {"status": "ok"}))
+    client = ThroomClient(gateway.url, timeout=0.2, circuit_breaker_threshold=0)
+
+    with pytest.raises(ThroomConnectionError):
+        client.cluster("c1").db().execute("INSERT INTO t VALUES (1)")
+    assert len(gateway.hits("POST", DB_EXECUTE)) == 1
+
+
+def test_read_failures_give_up_after_retry_budget(gateway, no_retry_sleep):
+    gateway.route("POST", CACHE_SET, drop)
+    client = ThroomClient(gateway.url, circuit_breaker_threshold=0)
+
+    with pytest.raises(ThroomConnectionError, match="Connection error"):
+        client.cluster("c1").cache().set("k", "v")
+    assert len(gateway.hits("POST", CACHE_SET)) == RETRY_TOTAL + 1
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda c: c.health(),
+        lambda c: c.cluster("c1").cache().set("k", "v"),
+        lambda c: c.cluster("c1").db().execute("DELETE FROM t"),
+    ],
+    ids=["get", "idempotent-post", "post"],
+)
+def test_connect_failures_retried_by_one_layer(refused_url, no_retry_sleep, monkeypatch, call):
+    connects = []
+    new_conn = urllib3.connection.HTTPConnection._new_conn
+
+    def counting_new_conn(self):
+        connects.append(self.port)
+        return new_conn(self)
+
+    monkeypatch.setattr(urllib3.connection.HTTPConnection, "_new_conn", counting_new_conn)
+    client = ThroomClient(refused_url, circuit_breaker_threshold=0)
+
+    with pytest.raises(ThroomConnectionError):
+        call(client)
+    assert len(connects) == RETRY_TOTAL + 1
+
+
+def test_retry_after_honored_and_capped():
+    def response(retry_after):
+        return SimpleNamespace(headers={"retry-after": retry_after})
+
+    assert _retry_delay(0, response("2")) == 2.0
+    assert _retry_delay(0, response("3600")) == RETRY_MAX_BACKOFF
+    # HTTP-date values fall back to exponential backoff
+    assert _retry_delay(0, response("Wed, 21 Oct 2015 07:28:00 GMT")) <= 0.2
+    assert _retry_delay(0) <= 0.2
+
+
+class TestAsync:
+    @pytest.fixture(autouse=True)
+    def _httpx(self):
+        pytest.importorskip("httpx")
+
+    def run(self, gateway, call):
+        from throome import AsyncThroomClient
+
+        async def main():
+            async with AsyncThroomClient(gateway.url, circuit_breaker_threshold=0) as client:
+                return await call(client)
+
+        return asyncio.run(main())
+
+    def test_get_retried_until_success(self, gateway, no_retry_sleep):
+        gateway.route("GET", HEALTH, UNAVAILABLE, HEALTHY)
+
+        assert self.run(gateway, lambda c: c.health()).status == "healthy"
+        assert len(gateway.hits("GET", HEALTH)) == 2
+
+    def test_non_idempotent_post_not_retried(self, gateway, no_retry_sleep):
+        gateway.route("POST", DB_EXECUTE, UNAVAILABLE)
+
+        with pytest.raises(ThroomAPIError):
+            self.run(gateway, lambda c: c.cluster("c1").db().execute("DELETE FROM t"))
+        assert len(gateway.hits("POST", DB_EXECUTE)) == 1
+
+    def test_query_only_retried_when_marked_idempotent(self, gateway, no_retry_sleep):
+        gateway.route("POST", DB_QUERY, UNAVAILABLE)
+
+        with pytest.raises(ThroomAPIError):
+            self.run(gateway, lambda c: c.cluster("c1").db().query("SELECT 1"))
+        assert len(gateway.hits("POST", DB_QUERY)) == 1
+
+        with pytest.raises(ThroomAPIError):
+            self.run(gateway, lambda c: c.cluster("c1").db().query("SELECT 1", idempotent=True))
+        assert len(gateway.hits("POST", DB_QUERY)) == 1 + RETRY_TOTAL + 1
+
+    def test_dropped_connection_on_idempotent_post_retried(self, gateway, no_retry_sleep):
+        gateway.route("POST", CACHE_SET, drop, CACHE_OK)
+
+        self.run(gateway, lambda c: c.cluster("c1").cache().set("k", "v"))
+        assert len(gateway.hits("POST", CACHE_SET)) == 2
+
+    def test_connect_failures_retried_for_every_method(self, no_retry_sleep):
+        import httpx
+
+        from throome import AsyncThroomClient
+
+        attempts = []
+
+        def refuse(request):
+            attempts.append(request.method)
+            raise httpx.ConnectError("refused", request=request)
+
+        async def main():
+            client = AsyncThroomClient("http://gateway", circuit_breaker_threshold=0)
+            await client.close()
+            client._client = httpx.AsyncClient(
+                base_url="http://gateway", transport=httpx.MockTransport(refuse)
+            )
+            async with client:
+                with pytest.raises(ThroomConnectionError):
+                    await client.cluster("c1").db().execute("DELETE FROM t")
+
+        asyncio.run(main())
+        assert attempts == ["POST"] * (RETRY_TOTAL + 1)
+
+    def test_read_timeout_on_non_idempotent_post_not_retried(self, no_retry_sleep):
+        import httpx
+
+        from throome import AsyncThroomClient
+
+        attempts = []
+
+        def time_out(request):
+            attempts.append(request.method)
+            raise httpx.ReadTimeout("slow", request=request)
+
+        async def main():
+            client = AsyncThroomClient("http://gateway", circuit_breaker_threshold=0)
+            await client.close()
+            client._client = httpx.AsyncClient(
+                base_url="http://gateway", transport=httpx.MockTransport(time_out)
+            )
+            async with client:
+                with pytest.raises(ThroomConnectionError):
+                    await client.cluster("c1").db().execute("DELETE FROM t")
+
+        asyncio.run(main())
+        assert attempts == ["POST"]
@@ -0,0 +1,92 @@
+"""Streaming service container logs"""
+
+import asyncio
+
+import pytest
+
+from throome import ThroomClient, ThroomConnectionError
+from throome.client import STREAM_CHUNK_SIZE
+from throome.types import LogOptions
+
+from conftest import Reply, json_reply
+
+LOGS = "/api/v1/clusters/c1/services/redis-1/logs"
+
+# Spans several stream chunks
+LOG_OUTPUT = b"line\n" * (STREAM_CHUNK_SIZE // 2)
+
+
+def logs_reply():
+    return Reply(200, LOG_OUTPUT, {"Content-Type": "text/plain"})
+
+
+def test_get_logs_stream_yields_bounded_chunks(gateway):
+    gateway.route("GET", LOGS, logs_reply())
+    service = ThroomClient(gateway.url).cluster("c1").service("redis-1")
+
+    chunks = list(service.get_logs_stream(LogOptions(tail=100, timestamps=True)))
+
+    assert len(chunks) > 1
+    assert max(map(len, chunks)) <= STREAM_CHUNK_SIZE
+    assert b"".join(chunks) == LOG_OUTPUT
+    assert gateway.hits("GET", LOGS)[0].query == "tail=100&timestamps=true"
+
+
+def test_get_logs_decodes_the_whole_output(gateway):
+    gateway.route("GET", LOGS, logs_reply())
+    service = ThroomClient(gateway.url).cluster("c1").service("redis-1")
+
+    assert service.get_logs() == LOG_OUTPUT.decode()
+    assert gateway.hits("GET", LOGS)[0].query == ""
+
+
+def test_get_logs_maps_error_statuses(gateway):
+    gateway.route("GET", LOGS, json_reply(404, {"error": "Service not found"}))
+    service = ThroomClient(gateway.url).cluster("c1").service("redis-1")
+
+    with pytest.raises(ThroomConnectionError, match="Failed to get logs"):
+        service.get_logs()
+
+
+def test_get_logs_maps_connection_failures(refused_url, no_retry_sleep):
+    service = ThroomClient(refused_url).cluster("c1").service("redis-1")
+
+    with pytest.raises(ThroomConnectionError, match="Failed to get logs"):
+        service.get_logs()
+
+
+class TestAsync:
+    @pytest.fixture(autouse=True)
+    def _httpx(self):
+        pytest.importorskip("httpx")
+
+    def run(self, url, call):
+        from throome import AsyncThroomClient
+
+        async def main():
+            async with AsyncThroomClient(url) as client:
+                return await call(client.cluster("c1").service("redis-1"))
+
+        return asyncio.run(main())
+
+    def test_get_logs_stream_yields_bounded_chunks(self, gateway):
+        gateway.route("GET", LOGS, logs_reply())
+
+        async def collect(service):
+            return [chunk async for chunk in service.get_logs_stream(LogOptions(tail=100))]
+
+        chunks = self.run(gateway.url, collect)
+
+        assert max(map(len, chunks)) <= STREAM_CHUNK_SIZE
+        assert b"".join(chunks) == LOG_OUTPUT
+        assert gateway.hits("GET", LOGS)[0].query == "tail=100"
+
+    def test_get_logs_maps_error_statuses(self, gateway):
+        gateway.route("GET", LOGS, json_reply(404, {"error": "Service not found"}))
+
+        with pytest.raises(ThroomConnectionError, match="Failed to get logs"):
+            self.run(gateway.url, lambda service: service.get_logs())
+
+    def test_get_logs_maps_connection_failures(self, refused_url):
+        with pytest.raises(ThroomConnectionError, match="Failed to get logs"):
+            self.run(refused_url, lambda service: service.get_logs())
@@ -0,0 +1,67 @@
+"""Parsing of the gateway's Go-formatted timestamps"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import throome.types
+from throome.types import ActivityLog, Cluster, _parse_datetime
+
+
+@pytest.fixture(params=["stdlib", "ciso8601"])
+def parser(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(throome.types, "_fast_parse_datetime", None)
+    elif throome.types._fast_parse_datetime is None:
+        pytest.skip("ciso8601 not installed")
+    return _parse_datetime
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        # Go's RFC3339Nano: nanoseconds and a Z suffix
+        (
+            "2024-01-02T03:04:05.123456789Z",
+            datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc),
+        ),
+        ("2024-01-02T03:04:05Z", datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)),
+        # Go trims trailing zeros, so fractions come in any width
+        ("2024-01-02T03:04:05.5Z", datetime(2024, 1, 2, 3, 4, 5, 500000, tzinfo=timezone.utc)),
+        (
+            "2024-01-02T03:04:05.123+05:30",
+            datetime(2024, 1, 2, 3, 4, 5, 123000, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+        ),
+    ],
+)
+def test_parse_datetime(parser, value, expected):
+    parsed = parser(value)
+
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+def test_parse_datetime_passes_datetimes_through():
+    now = datetime.now(timezone.utc)
+
+    assert _parse_datetime(now) is now
+
+
+def test_dataclasses_parse_their_timestamps():
+    cluster = Cluster(id="c1", name="demo", created_at="2024-01-02T03:04:05.000000001Z")
+    log = ActivityLog(
+        id="a1",
+        timestamp="2024-01-02T03:04:05.999999999Z",
+        cluster_id="c1",
+        service_name="redis-1",
+        service_type="redis",
+        operation="GET",
+        command="GET k",
+        parameters=[],
+        duration=5,
+        status="success",
+        response="value",
+    )
+
+    assert cluster.created_at == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert log.timestamp == datetime(2024, 1, 2, 3, 4, 5, 999999, tzinfo=timezone.utc)